@@ -12,13 +12,16 @@ import sqlite3
 import hashlib
 import math
 from datetime import datetime, timedelta
+from contextvars import ContextVar
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 from pathlib import Path
 import threading
 from functools import wraps
 from loguru import logger
+import orjson
 
 # Twilio imports for alert system
 try:
@@ -35,7 +38,7 @@ from agents.agent2_report_analysis import process_user_report
 
 # Import Twilio service with error handling
 try:
-    from services.twilio_alert_service import twilio_service
+    from services.twilio_alert_service import twilio_service, summarize_bulk_results
     TWILIO_SERVICE_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Twilio service not available: {e}")
@@ -48,33 +51,71 @@ app.secret_key = os.getenv('FLASK_SECRET_KEY', 'coastal-hazard-dark-ui-secret')
 app.config['UPLOAD_FOLDER'] = 'static/uploads'
 app.config['MAX_CONTENT_LENGTH'] = 8 * 1024 * 1024  # 8 MB max file size
 
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Serve jsonify responses and request bodies through orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        default = kwargs.pop('default', self.default)
+        sort_keys = kwargs.pop('sort_keys', self.sort_keys)
+        if kwargs:
+            # indent, ensure_ascii and other stdlib-only options keep Flask's encoder
+            return super().dumps(obj, default=default, sort_keys=sort_keys, **kwargs)
+        
+        # Datetimes fall through to `default` so their format is unchanged
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = OrjsonJSONProvider(app)
+
 # Language support
 TRANSLATIONS = {}
 
+# Language of the current request, resolved once per request from the session
+_CURRENT_LANG = ContextVar('current_language', default='en')
+
+# Every translation node keyed by "<lang>|<dotted.key>", built once per load
+_FLAT_TRANSLATIONS = {}
+
+def _flatten_translations(translations):
+    """Flatten nested translations into {"<lang>|<dotted.key>": value} without recursion."""
+    flat = {}
+    stack = [(f"{lang}|", data) for lang, data in translations.items() if isinstance(data, dict)]
+    while stack:
+        prefix, node = stack.pop()
+        for k, value in node.items():
+            flat_key = prefix + k
+            # Sections are kept too, so lookups of a section key still return the dict
+            flat[flat_key] = value
+            if isinstance(value, dict):
+                stack.append((flat_key + '.', value))
+    return flat
+
 def load_translations():
-    """Load translations from JSON file."""
-    global TRANSLATIONS
+    """Load translations from JSON file and flatten them for lookups."""
+    global TRANSLATIONS, _FLAT_TRANSLATIONS
     try:
         translations_file = Path(__file__).parent / 'config' / 'translations.json'
-        with open(translations_file, 'r', encoding='utf-8') as f:
-            TRANSLATIONS = json.load(f)
+        TRANSLATIONS = orjson.loads(translations_file.read_bytes())
+        _FLAT_TRANSLATIONS = _flatten_translations(TRANSLATIONS)
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Warning: Could not load translations: {e}")
         TRANSLATIONS = {'en': {'brand': 'Coastal Guard'}}
+        _FLAT_TRANSLATIONS = _flatten_translations(TRANSLATIONS)
 
 def get_translation(key, lang=None, **kwargs):
     """Get translated text for the given key."""
     if lang is None:
-        lang = session.get('language', 'en')
-    
-    keys = key.split('.')
-    text = TRANSLATIONS.get(lang, TRANSLATIONS.get('en', {}))
+        lang = _CURRENT_LANG.get()
     
-    for k in keys:
-        if isinstance(text, dict):
-            text = text.get(k, key)
-        else:
-            return key
+    # Unknown languages fall back to English; missing keys resolve to the key itself
+    if lang not in TRANSLATIONS:
+        lang = 'en'
+    text = _FLAT_TRANSLATIONS.get(f"{lang}|{key}", key)
     
     # Format with any provided kwargs
     if isinstance(text, str) and kwargs:
@@ -226,12 +267,17 @@ def extract_tweet_author_filter(post_text):
     
     return "unknown_user"
 
+@app.before_request
+def resolve_request_language():
+    """Resolve the session language once so t() calls skip the session lookup."""
+    _CURRENT_LANG.set(session.get('language', 'en'))
+
 # Make translation function available in templates
 @app.context_processor
 def inject_language_functions():
     return {
         't': get_translation,
-        'current_language': session.get('language', 'en'),
+        'current_language': _CURRENT_LANG.get(),
         'available_languages': {
             'en': 'English',
             'hi': 'हिंदी',
@@ -1295,7 +1341,7 @@ def admin_send_alert():
             sms_results = twilio_service.send_bulk_sms_alerts(
                 sms_recipients, message_content, report_data
             )
-            results['sms'] = sms_results
+            results['sms'] = summarize_bulk_results(sms_results)
             results['total_successful'] += sms_results['successful']
             results['total_failed'] += sms_results['failed']
         
@@ -1303,7 +1349,7 @@ def admin_send_alert():
             voice_results = twilio_service.make_bulk_voice_alerts(
                 voice_recipients, message_content, report_data
             )
-            results['voice'] = voice_results
+            results['voice'] = summarize_bulk_results(voice_results)
             results['total_successful'] += voice_results['successful']
             results['total_failed'] += voice_results['failed']
         
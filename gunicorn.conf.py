@@ -9,11 +9,14 @@ bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
 backlog = 2048
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"  # Use "gevent" if you need async support
+# gthread workers serve several requests per process, so slow upstream calls
+# do not pin a whole worker; WEB_CONCURRENCY/GUNICORN_THREADS override sizing
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
 worker_connections = 1000
 timeout = 30
-keepalive = 2
+keepalive = 30
 max_requests = 1000
 max_requests_jitter = 100
 
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Template generation script for the Dual Portal application
+Writes (or refreshes) the basic HTML templates in tests/templates. The app also
+generates them on startup when that folder is missing.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the dual portal app importable
+sys.path.append(str(Path(__file__).parent.parent / 'tests'))
+
+from app_dual_portal_fixed import app, create_basic_templates
+
+def main():
+    """Generate the basic templates and report how many files changed."""
+    with app.app_context():
+        result = create_basic_templates().get_json()
+    
+    print(f"✅ Templates generated ({result['written']} files written)")
+
+if __name__ == "__main__":
+    main()
@@ -4,16 +4,66 @@ Processes user reports, generates search keywords via LLM, and correlates with s
 """
 
 import os
-import json
 import asyncio
 import aiohttp
 import uuid
-import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 import math
 import re
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import orjson
+
+# Posts scored per DeepSeek request, and the completion budget for each
+CORRELATION_BATCH_SIZE = 20
+BATCH_TOKENS_PER_POST = 300
+_VERDICT_REQUIRED_KEYS = ('hazard_detected', 'urgency', 'confidence')
+
+# Stop scoring further batches once the best correlation is already strong and
+# the latest batch fell well short of it (AGENT2_EARLY_EXIT=0 scores every post)
+EARLY_EXIT_ENABLED = os.getenv('AGENT2_EARLY_EXIT', '1').lower() not in ('0', 'false', 'no')
+EARLY_EXIT_CONFIDENCE = 0.9
+EARLY_EXIT_MARGIN = 0.2
+
+# Per-request timeout (seconds) for RapidAPI Twitter searches
+RAPIDAPI_TIMEOUT = 15
+
+# Keep-alive HTTP session for the current unit of work (one report, one test
+# run). A context variable rather than an attribute, because concurrent reports
+# share the agent instance and each session belongs to the loop that opened it.
+_HTTP_SESSION = ContextVar('agent2_http_session', default=None)
+
+# COASTAL_OFFLINE=1 leaves the agent without API keys, so every step takes its
+# deterministic non-network fallback (basic keywords, simulated posts, keyword
+# hazard analysis)
+OFFLINE_MODE = os.getenv('COASTAL_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+
+def _keyword_re(words: List[str]) -> 're.Pattern':
+    """Compile a keyword list into one alternation; same substring semantics as any(w in text)."""
+    return re.compile('|'.join(re.escape(word) for word in words))
+
+
+# Keyword cues for the non-LLM scorers, compiled once so each post is scanned
+# once per cue list instead of once per keyword
+_HAZARD_KEYWORD_RES = (
+    ('Flood', _keyword_re(['flood', 'flooding', 'water', 'rain', 'inundated', 'waterlogged', 'baarish', 'paani'])),
+    ('Storm Surge', _keyword_re(['surge', 'storm', 'cyclone', 'hurricane', 'toofan'])),
+    ('High Waves', _keyword_re(['waves', 'tsunami', 'tidal', 'sea', 'ocean', 'samundar'])),
+    ('Coastal Erosion', _keyword_re(['erosion', 'coast', 'beach', 'shore'])),
+)
+_HIGH_URGENCY_RE = _keyword_re(['emergency', 'evacuate', 'rescue', 'life threatening', 'trapped'])
+_MEDIUM_URGENCY_RE = _keyword_re(['urgent', 'help', 'danger', 'severe', 'heavy'])
+_WORSENING_RE = _keyword_re(['rising', 'increasing', 'getting worse', 'warning'])
+_HINDI_HINT_RE = _keyword_re(['paani', 'baarish', 'toofan', 'samundar'])
+_RECENT_RE = _keyword_re(['now', 'currently', 'right now', 'happening', 'just', 'minutes ago', 'hours ago'])
+_STRONG_CUES_RE = _keyword_re(['emergency', 'evacuate', 'evacuation', 'rescue', 'immediately', 'life threatening',
+                               'impassable', 'trapped', 'collapsed', 'collapse', 'mayday'])
+_MODERATE_CUES_RE = _keyword_re(['rising', 'increasing', 'severe', 'heavy', 'warning', 'alert', 'overflow',
+                                 'breach', 'breached'])
+_DOWN_CUES_RE = _keyword_re(['rumor', 'hoax', 'false alarm', 'fake', 'test drill', 'drill'])
 
 class ReportAnalysisAgent:
     """Agent 2: Processes user reports and correlates with social media data"""
@@ -25,6 +75,12 @@ class ReportAnalysisAgent:
         
         # RapidAPI Twitter configuration
         self.rapidapi_key = os.getenv('RAPIDAPI_KEY')
+        
+        if OFFLINE_MODE:
+            logger.info("COASTAL_OFFLINE set: skipping DeepSeek and RapidAPI calls")
+            self.deepseek_api_key = None
+            self.rapidapi_key = None
+        
         self.twitter_api_url = "https://twitter-api47.p.rapidapi.com/v2/search"
         self.twitter_headers = {
             "X-RapidAPI-Key": self.rapidapi_key,
@@ -76,6 +132,24 @@ Your responsibilities:
 
         logger.info("Agent 2 (Report Analysis) initialized")
 
+    @asynccontextmanager
+    async def http_session(self):
+        """
+        Share one pooled aiohttp session across the DeepSeek calls made inside
+        this block, so they reuse TCP/TLS connections.
+        """
+        if _HTTP_SESSION.get() is not None:
+            yield _HTTP_SESSION.get()
+            return
+        
+        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            token = _HTTP_SESSION.set(session)
+            try:
+                yield session
+            finally:
+                _HTTP_SESSION.reset(token)
+    
     async def process_user_report(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a user report through the complete analysis pipeline.
@@ -86,6 +160,11 @@ Your responsibilities:
         Returns:
             Enhanced report data with keywords and correlations
         """
+        async with self.http_session():
+            return await self._process_user_report(report_data)
+    
+    async def _process_user_report(self, report_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the analysis pipeline for process_user_report."""
         logger.info(f"Processing user report: {report_data.get('title', 'Untitled')}")
         
         try:
@@ -250,14 +329,17 @@ Generate comprehensive search keywords to find related social media posts."""
         }
         
         try:
-            # Use synchronous requests (can be made async later if needed)
-            response = requests.get(self.twitter_api_url, headers=self.twitter_headers, params=querystring)
-            
-            if response.status_code != 200:
-                logger.error(f"RapidAPI request failed with status {response.status_code}: {response.text}")
-                return []
+            # Non-blocking request on the shared session, so a slow search does
+            # not stall other reports running on the same event loop
+            async with self.http_session() as session:
+                async with session.get(self.twitter_api_url, headers=self.twitter_headers, params=querystring,
+                                       timeout=aiohttp.ClientTimeout(total=RAPIDAPI_TIMEOUT)) as response:
+                    if response.status != 200:
+                        logger.error(f"RapidAPI request failed with status {response.status}: {await response.text()}")
+                        return []
+                    
+                    data = orjson.loads(await response.read())
             
-            data = response.json()
             real_posts = []
             
             # Process tweets - handle different possible field names
@@ -340,32 +422,34 @@ Generate comprehensive search keywords to find related social media posts."""
         logger.info(f"📊 Starting correlation analysis for {len(social_posts)} social media posts")
         correlations = []
         
-        for i, post in enumerate(social_posts, 1):
-            try:
-                post_text = post.get('text', '')
-                print(f"\n📝 TWEET {i}/{len(social_posts)}:")
-                print(f"{'─'*50}")
-                print(f"📱 Post ID: {post.get('id', 'N/A')}")
-                print(f"👤 Author: {post.get('author', 'N/A')}")
-                print(f"📅 Posted: {post.get('created_at', 'N/A')}")
-                print(f"💬 Content: {post_text}")
-                print(f"{'─'*50}")
-                
-                logger.info(f"🔍 Analyzing post {i}/{len(social_posts)}: {post_text[:30]}...")
-                correlation = await self._analyze_single_correlation(report_data, post)
-                
-                confidence_score = correlation.get('correlation_score', 0)
-                logger.info(f"🎯 Post {i} correlation score: {confidence_score:.2f}")
-                
-                if confidence_score > 0.3:  # Only keep significant correlations
-                    correlations.append(correlation)
-                    logger.info(f"✅ Post {i} added to correlations (score > 0.3)")
-                else:
-                    logger.info(f"❌ Post {i} filtered out (score ≤ 0.3)")
-                    
-            except Exception as e:
-                logger.error(f"⚠️ Error analyzing correlation for post {post.get('id')}: {str(e)}")
+        analyzed = []
+        best_score = 0.0
+        for start in range(0, len(social_posts), CORRELATION_BATCH_SIZE):
+            chunk = social_posts[start:start + CORRELATION_BATCH_SIZE]
+            batch = await self._analyze_correlations_batch(report_data, chunk, start, len(social_posts))
+            analyzed.extend(batch)
+            
+            batch_best = max((c.get('correlation_score', 0) for c in batch if c), default=0.0)
+            best_score = max(best_score, batch_best)
+            if (EARLY_EXIT_ENABLED and best_score >= EARLY_EXIT_CONFIDENCE
+                    and batch_best < best_score - EARLY_EXIT_MARGIN
+                    and start + CORRELATION_BATCH_SIZE < len(social_posts)):
+                logger.info(f"⏹️ Stopping after {len(analyzed)} of {len(social_posts)} posts: "
+                            f"best score {best_score:.2f} reached and the last batch peaked at {batch_best:.2f}")
+                break
+        
+        for i, correlation in enumerate(analyzed, 1):
+            if correlation is None:
                 continue
+            
+            confidence_score = correlation.get('correlation_score', 0)
+            logger.info(f"🎯 Post {i} correlation score: {confidence_score:.2f}")
+            
+            if confidence_score > 0.3:  # Only keep significant correlations
+                correlations.append(correlation)
+                logger.info(f"✅ Post {i} added to correlations (score > 0.3)")
+            else:
+                logger.info(f"❌ Post {i} filtered out (score ≤ 0.3)")
         
         # Sort by correlation score
         correlations.sort(key=lambda x: x.get('correlation_score', 0), reverse=True)
@@ -378,7 +462,7 @@ Generate comprehensive search keywords to find related social media posts."""
         
         print(f"\n🏁 ANALYSIS SUMMARY:")
         print(f"{'='*50}")
-        print(f"📊 Total Posts Analyzed: {len(social_posts)}")
+        print(f"📊 Total Posts Analyzed: {len(analyzed)} of {len(social_posts)}")
         print(f"✅ Posts Passed Filter (>0.3): {len(correlations)}")
         print(f"🚨 Urgency Distribution:")
         print(f"   • High: {urgency_stats['High']} posts")
@@ -393,6 +477,113 @@ Generate comprehensive search keywords to find related social media posts."""
         logger.info(f"📊 Urgency distribution - High:{urgency_stats['High']}, Medium:{urgency_stats['Medium']}, Low:{urgency_stats['Low']}")
         return correlations
 
+    def _print_post_header(self, post: Dict[str, Any], number: int, total: int) -> None:
+        """Print the terminal banner for one post under analysis."""
+        print(f"\n📝 TWEET {number}/{total}:")
+        print(f"{'─'*50}")
+        print(f"📱 Post ID: {post.get('id', 'N/A')}")
+        print(f"👤 Author: {post.get('author', 'N/A')}")
+        print(f"📅 Posted: {post.get('created_at', 'N/A')}")
+        print(f"💬 Content: {post.get('text', '')}")
+        print(f"{'─'*50}")
+
+    async def _analyze_correlations_batch(
+        self,
+        report_data: Dict[str, Any],
+        posts: List[Dict[str, Any]],
+        offset: int = 0,
+        total: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Score several posts against a report with a single DeepSeek request.
+        
+        The report location is sent once with all posts, and the model returns
+        one verdict per post. Posts whose verdict is missing or malformed (or
+        all posts, if the request fails) go through _analyze_single_correlation.
+        
+        Args:
+            report_data: User report the posts are compared with
+            posts: Up to CORRELATION_BATCH_SIZE social media posts
+            offset: Index of the first post in the full list (for progress output)
+            total: Size of the full list (defaults to len(posts))
+            
+        Returns:
+            One correlation dict per post, in order; None where analysis raised
+        """
+        total = total or len(posts)
+        location = f"{report_data.get('city', 'Unknown')}, {report_data.get('state', 'India')}"
+        
+        posts_json = orjson.dumps([
+            {'id': str(i), 'text': post.get('text', ''), 'timestamp': post.get('created_at', '')}
+            for i, post in enumerate(posts)
+        ]).decode('utf-8')
+        
+        user_prompt = f"""New Social Media Signals
+
+User Location (if available): "{location}"
+Posts (JSON array; text may be in multiple languages):
+{posts_json}
+
+For EACH post, perform the same analysis as for a single signal:
+1. Event Detection (Multilingual): detect whether it indicates an ocean or coastal hazard, its type ["Flood", "Tsunami", "Storm Surge", "High Waves", "Coastal Erosion", "Other"] and urgency (Low/Medium/High).
+2. Historical Pattern Analysis: one-line precedent of similar past events in the region.
+3. Seasonal & Probabilistic Context: whether similar events cluster in this season/month.
+4. Risk Communication: one actionable recommendation and a concise summary.
+
+Output Format: Strict JSON only, an array with one object per post:
+[
+  {{
+    "id": "The post's id from the input",
+    "original_language": "Detected language code (e.g., hi, ta, te, en, etc.)",
+    "hazard_detected": true/false,
+    "hazard_type": "Flood/Tsunami/Storm Surge/High Waves/Coastal Erosion/Other",
+    "urgency": "Low/Medium/High",
+    "confidence": 0.0-1.0,
+    "historical_context": "One-line summary of past similar events or null",
+    "seasonal_pattern": "Yes/No with explanation",
+    "recommended_action": "One-line recommendation",
+    "final_summary": "Concise human-readable intelligence for decision-makers"
+  }}
+]"""
+        
+        verdicts = {}
+        try:
+            logger.info(f"🤖 Sending {len(posts)} tweets to DeepSeek LLM in one request")
+            response = await self._call_deepseek_api(
+                self.hazard_analysis_prompt,
+                user_prompt,
+                max_tokens=BATCH_TOKENS_PER_POST * len(posts)
+            )
+            if isinstance(response, list):
+                verdicts = {
+                    str(item.get('id')): item for item in response
+                    if isinstance(item, dict) and all(key in item for key in _VERDICT_REQUIRED_KEYS)
+                    and isinstance(item['confidence'], (int, float))
+                }
+            else:
+                logger.warning("DeepSeek batch response was not a JSON array; analyzing posts one by one")
+        except Exception as e:
+            logger.error(f"❌ DeepSeek batch analysis failed: {str(e)}; analyzing posts one by one")
+        
+        results = []
+        for i, post in enumerate(posts):
+            self._print_post_header(post, offset + i + 1, total)
+            try:
+                verdict = verdicts.get(str(i))
+                if verdict is None:
+                    results.append(await self._analyze_single_correlation(report_data, post))
+                    continue
+                
+                verdict = {key: value for key, value in verdict.items() if key != 'id'}
+                print(f"\n🤖 DEEPSEEK LLM ANALYSIS:")
+                print(f"{'='*60}")
+                results.append(self._finalize_llm_analysis(report_data, post, verdict, location))
+            except Exception as e:
+                logger.error(f"⚠️ Error analyzing correlation for post {post.get('id')}: {str(e)}")
+                results.append(None)
+        
+        return results
+
     async def _analyze_single_correlation(
         self, 
         report_data: Dict[str, Any], 
@@ -455,65 +646,7 @@ Tasks:
                 user_prompt
             )
             
-            # Normalize urgency to avoid over-classification as High
-            normalized_urgency = self._normalize_urgency(
-                hazard_analysis.get('urgency', 'Low'),
-                hazard_analysis.get('confidence', 0.0),
-                post_text
-            )
-            hazard_analysis['urgency'] = normalized_urgency
-            
-            # Display detailed LLM results in terminal
-            print(f"✅ DEEPSEEK ANALYSIS RESULTS:")
-            print(f"{'-'*40}")
-            print(f"🌍 Original Language: {hazard_analysis.get('original_language', 'N/A')}")
-            print(f"⚠️ Hazard Detected: {hazard_analysis.get('hazard_detected', 'N/A')}")
-            print(f"🌊 Hazard Type: {hazard_analysis.get('hazard_type', 'N/A')}")
-            print(f"🚨 Urgency Level: {hazard_analysis.get('urgency', 'N/A')}")
-            print(f"📊 Confidence Score: {hazard_analysis.get('confidence', 'N/A')}")
-            print(f"📅 Historical Context: {hazard_analysis.get('historical_context', 'N/A')}")
-            print(f"🍂 Seasonal Pattern: {hazard_analysis.get('seasonal_pattern', 'N/A')}")
-            print(f"💡 Recommended Action: {hazard_analysis.get('recommended_action', 'N/A')}")
-            print(f"📝 Final Summary: {hazard_analysis.get('final_summary', 'N/A')}")
-            print(f"{'-'*40}")
-            print(f"{'='*60}\n")
-            
-            logger.info(f"✅ DeepSeek analysis complete with confidence: {hazard_analysis.get('confidence', 0)}")
-            
-            # Add enhanced metadata for admin display
-            hazard_analysis['post_id'] = post_data.get('id')
-            hazard_analysis['post_text'] = post_data.get('text', '')
-            hazard_analysis['post_text_preview'] = post_data.get('text', '')[:100] + '...' if len(post_data.get('text', '')) > 100 else post_data.get('text', '')
-            hazard_analysis['post_author'] = post_data.get('author', 'Unknown')
-            hazard_analysis['post_source'] = post_data.get('source', 'twitter')
-            hazard_analysis['post_location'] = location
-            hazard_analysis['analyzed_at'] = datetime.now().isoformat()
-            hazard_analysis['correlation_score'] = hazard_analysis.get('confidence', 0.0)  # Use LLM confidence as correlation
-            
-            # Add severity classification based on urgency and confidence
-            urgency = hazard_analysis.get('urgency', 'Low')
-            confidence = hazard_analysis.get('confidence', 0.0)
-            
-            if urgency == 'High' and confidence > 0.7:
-                hazard_analysis['severity_class'] = 'critical'
-                hazard_analysis['priority_score'] = 5
-            elif urgency == 'High' or (urgency == 'Medium' and confidence > 0.8):
-                hazard_analysis['severity_class'] = 'high'
-                hazard_analysis['priority_score'] = 4
-            elif urgency == 'Medium' and confidence > 0.6:
-                hazard_analysis['severity_class'] = 'medium'
-                hazard_analysis['priority_score'] = 3
-            elif confidence > 0.5:
-                hazard_analysis['severity_class'] = 'low'
-                hazard_analysis['priority_score'] = 2
-            else:
-                hazard_analysis['severity_class'] = 'minimal'
-                hazard_analysis['priority_score'] = 1
-            
-            # Add matching elements for filtering
-            hazard_analysis['matching_elements'] = self._extract_matching_elements(report_data, post_data, hazard_analysis)
-            
-            return hazard_analysis
+            return self._finalize_llm_analysis(report_data, post_data, hazard_analysis, location)
             
         except Exception as e:
             print(f"\n❌ DEEPSEEK LLM FAILED - USING FALLBACK:")
@@ -541,39 +674,102 @@ Tasks:
             
             return fallback_result
     
+    def _finalize_llm_analysis(
+        self,
+        report_data: Dict[str, Any],
+        post_data: Dict[str, Any],
+        hazard_analysis: Dict[str, Any],
+        location: str
+    ) -> Dict[str, Any]:
+        """Normalize, display and annotate one LLM verdict for a post."""
+        post_text = post_data.get('text', '')
+        
+        # Normalize urgency to avoid over-classification as High
+        normalized_urgency = self._normalize_urgency(
+            hazard_analysis.get('urgency', 'Low'),
+            hazard_analysis.get('confidence', 0.0),
+            post_text
+        )
+        hazard_analysis['urgency'] = normalized_urgency
+        
+        # Display detailed LLM results in terminal
+        print(f"✅ DEEPSEEK ANALYSIS RESULTS:")
+        print(f"{'-'*40}")
+        print(f"🌍 Original Language: {hazard_analysis.get('original_language', 'N/A')}")
+        print(f"⚠️ Hazard Detected: {hazard_analysis.get('hazard_detected', 'N/A')}")
+        print(f"🌊 Hazard Type: {hazard_analysis.get('hazard_type', 'N/A')}")
+        print(f"🚨 Urgency Level: {hazard_analysis.get('urgency', 'N/A')}")
+        print(f"📊 Confidence Score: {hazard_analysis.get('confidence', 'N/A')}")
+        print(f"📅 Historical Context: {hazard_analysis.get('historical_context', 'N/A')}")
+        print(f"🍂 Seasonal Pattern: {hazard_analysis.get('seasonal_pattern', 'N/A')}")
+        print(f"💡 Recommended Action: {hazard_analysis.get('recommended_action', 'N/A')}")
+        print(f"📝 Final Summary: {hazard_analysis.get('final_summary', 'N/A')}")
+        print(f"{'-'*40}")
+        print(f"{'='*60}\n")
+        
+        logger.info(f"✅ DeepSeek analysis complete with confidence: {hazard_analysis.get('confidence', 0)}")
+        
+        # Add enhanced metadata for admin display
+        hazard_analysis['post_id'] = post_data.get('id')
+        hazard_analysis['post_text'] = post_data.get('text', '')
+        hazard_analysis['post_text_preview'] = post_data.get('text', '')[:100] + '...' if len(post_data.get('text', '')) > 100 else post_data.get('text', '')
+        hazard_analysis['post_author'] = post_data.get('author', 'Unknown')
+        hazard_analysis['post_source'] = post_data.get('source', 'twitter')
+        hazard_analysis['post_location'] = location
+        hazard_analysis['analyzed_at'] = datetime.now().isoformat()
+        hazard_analysis['correlation_score'] = hazard_analysis.get('confidence', 0.0)  # Use LLM confidence as correlation
+        
+        # Add severity classification based on urgency and confidence
+        urgency = hazard_analysis.get('urgency', 'Low')
+        confidence = hazard_analysis.get('confidence', 0.0)
+        
+        if urgency == 'High' and confidence > 0.7:
+            hazard_analysis['severity_class'] = 'critical'
+            hazard_analysis['priority_score'] = 5
+        elif urgency == 'High' or (urgency == 'Medium' and confidence > 0.8):
+            hazard_analysis['severity_class'] = 'high'
+            hazard_analysis['priority_score'] = 4
+        elif urgency == 'Medium' and confidence > 0.6:
+            hazard_analysis['severity_class'] = 'medium'
+            hazard_analysis['priority_score'] = 3
+        elif confidence > 0.5:
+            hazard_analysis['severity_class'] = 'low'
+            hazard_analysis['priority_score'] = 2
+        else:
+            hazard_analysis['severity_class'] = 'minimal'
+            hazard_analysis['priority_score'] = 1
+        
+        # Add matching elements for filtering
+        hazard_analysis['matching_elements'] = self._extract_matching_elements(report_data, post_data, hazard_analysis)
+        
+        return hazard_analysis
+    
     def _basic_hazard_analysis(self, report_data: Dict[str, Any], post_data: Dict[str, Any]) -> Dict[str, Any]:
         """Fallback hazard analysis without LLM using your exact output format."""
         
         post_text = post_data.get('text', '').lower()
         location = f"{report_data.get('city', 'Unknown')}, {report_data.get('state', 'India')}"
         
-        # Basic hazard detection
-        hazard_keywords = {
-            'Flood': ['flood', 'flooding', 'water', 'rain', 'inundated', 'waterlogged', 'baarish', 'paani'],
-            'Storm Surge': ['surge', 'storm', 'cyclone', 'hurricane', 'toofan'],
-            'High Waves': ['waves', 'tsunami', 'tidal', 'sea', 'ocean', 'samundar'],
-            'Coastal Erosion': ['erosion', 'coast', 'beach', 'shore']
-        }
-        
         detected_hazard = 'Other'
         hazard_detected = False
         confidence = 0.5
         urgency = 'Low'
         
-        for hazard_type, keywords in hazard_keywords.items():
-            if any(keyword in post_text for keyword in keywords):
+        # Basic hazard detection
+        for hazard_type, hazard_re in _HAZARD_KEYWORD_RES:
+            if hazard_re.search(post_text):
                 detected_hazard = hazard_type
                 hazard_detected = True
                 confidence = 0.6  # Start more conservative
                 
                 # More conservative urgency indicators
-                if any(word in post_text for word in ['emergency', 'evacuate', 'rescue', 'life threatening', 'trapped']):
+                if _HIGH_URGENCY_RE.search(post_text):
                     urgency = 'High'
                     confidence = 0.75
-                elif any(word in post_text for word in ['urgent', 'help', 'danger', 'severe', 'heavy']):
+                elif _MEDIUM_URGENCY_RE.search(post_text):
                     urgency = 'Medium'
                     confidence = 0.65
-                elif any(word in post_text for word in ['rising', 'increasing', 'getting worse', 'warning']):
+                elif _WORSENING_RE.search(post_text):
                     urgency = 'Medium'
                     confidence = 0.6
                 else:
@@ -583,7 +779,7 @@ Tasks:
         
         # Detect language (basic)
         original_language = 'en'  # Default
-        if any(word in post_text for word in ['paani', 'baarish', 'toofan', 'samundar']):
+        if _HINDI_HINT_RE.search(post_text):
             original_language = 'hi'  # Hindi indicators
         
         fallback_result = {
@@ -745,8 +941,7 @@ Tasks:
     
     def _is_recent_post(self, post_text: str) -> bool:
         """Check if post contains recent time indicators."""
-        recent_indicators = ['now', 'currently', 'right now', 'happening', 'just', 'minutes ago', 'hours ago']
-        return any(indicator in post_text.lower() for indicator in recent_indicators)
+        return _RECENT_RE.search(post_text.lower()) is not None
     
     def _normalize_urgency(self, urgency: str, confidence: float, post_text: str) -> str:
         """Normalize urgency to reduce false 'High' classifications.
@@ -757,17 +952,14 @@ Tasks:
         - If negation/hoax cues present, force Low
         """
         text = (post_text or '').lower()
-        strong_cues = ['emergency', 'evacuate', 'evacuation', 'rescue', 'immediately', 'life threatening', 'impassable', 'trapped', 'collapsed', 'collapse', 'mayday']
-        moderate_cues = ['rising', 'increasing', 'severe', 'heavy', 'warning', 'alert', 'overflow', 'breach', 'breached']
-        down_cues = ['rumor', 'hoax', 'false alarm', 'fake', 'test drill', 'drill']
 
-        if any(c in text for c in down_cues):
+        if _DOWN_CUES_RE.search(text):
             return 'Low'
 
-        if any(c in text for c in strong_cues) and confidence >= 0.7:
+        if _STRONG_CUES_RE.search(text) and confidence >= 0.7:
             return 'High'
 
-        if any(c in text for c in moderate_cues) and confidence >= 0.55:
+        if _MODERATE_CUES_RE.search(text) and confidence >= 0.55:
             return 'Medium'
 
         # If model said High but cues are missing and confidence is not strong, downgrade
@@ -831,7 +1023,7 @@ Tasks:
         
         return R * c
 
-    async def _call_deepseek_api(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+    async def _call_deepseek_api(self, system_prompt: str, user_prompt: str, max_tokens: int = 500) -> Any:
         """Call DeepSeek API for analysis."""
         if not self.deepseek_api_key:
             raise Exception("DeepSeek API key not configured")
@@ -850,18 +1042,19 @@ Tasks:
                 {'role': 'user', 'content': user_prompt}
             ],
             'temperature': 0.1,
-            'max_tokens': 500
+            'max_tokens': max_tokens
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
+        async with self.http_session() as session:
+            # Pre-serialized body and raw-bytes parse skip aiohttp's stdlib json round trips
+            async with session.post(url, headers=headers, data=orjson.dumps(payload)) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     content = result['choices'][0]['message']['content'].strip()
                     
                     # Extract JSON from response (handle markdown code blocks)
                     json_content = self._extract_json_from_response(content)
-                    return json.loads(json_content)
+                    return orjson.loads(json_content)
                 else:
                     error_text = await response.text()
                     raise Exception(f"DeepSeek API error {response.status}: {error_text}")
@@ -870,16 +1063,15 @@ Tasks:
         """Extract JSON from response, handling markdown code blocks."""
         content = content.strip()
         
-        if content.startswith('```json') and content.endswith('```'):
-            lines = content.split('\n')
-            json_lines = lines[1:-1]
-            return '\n'.join(json_lines)
-        elif content.startswith('```') and content.endswith('```'):
-            lines = content.split('\n')
-            json_lines = lines[1:-1]
-            return '\n'.join(json_lines)
-        else:
-            return content
+        # Slice out the lines between the opening and closing fence
+        if content.startswith('```') and content.endswith('```'):
+            first_newline = content.find('\n')
+            last_newline = content.rfind('\n')
+            if first_newline == last_newline:
+                return ''
+            return content[first_newline + 1:last_newline]
+        
+        return content
 
 # Global instance
 report_analysis_agent = ReportAnalysisAgent()
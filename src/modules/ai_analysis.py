@@ -182,22 +182,15 @@ Classify this post according to the guidelines provided."""
         """Extract JSON from response, handling markdown code blocks."""
         content = content.strip()
         
-        # Check if content is wrapped in markdown code blocks
-        if content.startswith('```json') and content.endswith('```'):
-            # Remove the markdown wrapper
-            lines = content.split('\n')
-            # Remove first line (```json) and last line (```)
-            json_lines = lines[1:-1]
-            return '\n'.join(json_lines)
-        elif content.startswith('```') and content.endswith('```'):
-            # Handle generic code blocks
-            lines = content.split('\n')
-            # Remove first line (```) and last line (```)
-            json_lines = lines[1:-1]
-            return '\n'.join(json_lines)
-        else:
-            # Return as-is if no markdown wrapper
-            return content
+        # Slice out the lines between the opening and closing fence
+        if content.startswith('```') and content.endswith('```'):
+            first_newline = content.find('\n')
+            last_newline = content.rfind('\n')
+            if first_newline == last_newline:
+                return ''
+            return content[first_newline + 1:last_newline]
+        
+        return content
     
     def _validate_analysis_result(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and normalize the analysis result."""
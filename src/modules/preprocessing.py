@@ -5,14 +5,243 @@ Handles deduplication, text cleaning, language normalization, and location infer
 
 import re
 import os
+import atexit
+import asyncio
+import functools
+import threading
+import multiprocessing
 from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import pandas as pd
 from langdetect import detect
 from langdetect.lang_detect_exception import LangDetectException
 from geopy.geocoders import Nominatim
 from loguru import logger
 
+# Offline reverse geocoding is optional; Nominatim is the fallback
+try:
+    import reverse_geocoder
+    REVERSE_GEOCODER_AVAILABLE = True
+except ImportError:
+    REVERSE_GEOCODER_AVAILABLE = False
+
+# Aho-Corasick mention matching is optional; substring scans are the fallback
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# fastText language identification is optional; langdetect is the fallback
+try:
+    import fasttext
+    FASTTEXT_AVAILABLE = True
+except ImportError:
+    FASTTEXT_AVAILABLE = False
+
+# Batches smaller than this are cleaned in-process; shipping posts to worker
+# processes would dominate
+PARALLEL_CLEANING_MIN_POSTS = 1000
+# Posts sent to a worker process per task
+PARALLEL_CLEANING_CHUNK_SIZE = 256
+
+# Patterns are compiled once at import time; the cleaning functions run them
+# against every post in a batch.
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_MENTION_RE = re.compile(r'@\w+')
+_WS_RE = re.compile(r'\s+')
+_RETWEET_RE = re.compile(r'RT @|".*" — @\w+')
+_EMOJI_STRIP_RE = re.compile(r'[^\w\s\u0900-\u097F\u0980-\u09FF\u0A00-\u0A7F\u0A80-\u0AFF\u0B00-\u0B7F\u0B80-\u0BFF\u0C00-\u0C7F\u0C80-\u0CFF\u0D00-\u0D7F#@.,!?:;()-]')
+# Same filter as a str.translate table for the ASCII-only fast path, where
+# translate beats the regex engine (for non-ASCII text it is slower)
+_ASCII_STRIP_TABLE = {codepoint: None for codepoint in range(128) if _EMOJI_STRIP_RE.match(chr(codepoint))}
+
+# Flood/water related emojis that survive emoji stripping
+_WATER_EMOJIS = ['🌊', '💧', '🌧️', '⛈️', '🌀', '⚠️', '🚨', '🆘']
+_WATER_EMOJI_RE = re.compile('|'.join(map(re.escape, _WATER_EMOJIS)))
+
+_ABBREV_MAP = {
+    'u': 'you',
+    'ur': 'your',
+    'r': 'are',
+    'n': 'and',
+    'w/': 'with',
+    'w/o': 'without',
+    'tho': 'though',
+    'thru': 'through',
+    'coz': 'because',
+    'bcoz': 'because',
+}
+# Longest alternatives first so 'w/o' is not consumed as 'w/' + 'o'
+_ABBREV_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(_ABBREV_MAP, key=len, reverse=True))) + r')\b',
+    re.IGNORECASE
+)
+
+_SPAM_INDICATORS = [
+    r'buy now',
+    r'click here',
+    r'limited time',
+    r'call now',
+    r'visit our website',
+    r'download app',
+    r'free download',
+    r'get \d+% off',
+    r'subscribe to',
+    r'follow us',
+    r'like and share',
+    r'dm for',
+]
+# One group per indicator inside a lookahead, so a single scan also finds
+# overlapping indicators (e.g. 'free download app')
+_SPAM_RE = re.compile('(?=' + '|'.join(f'({pattern})' for pattern in _SPAM_INDICATORS) + ')')
+
+
+def _strip_links_and_mentions(text: str) -> Tuple[str, str]:
+    """Return the text without URLs, and without URLs or mentions (stripped)."""
+    without_urls = _URL_RE.sub('', text)
+    return without_urls, _MENTION_RE.sub('', without_urls).strip()
+
+
+def _normalize_abbreviations(text: str) -> str:
+    """Normalize common abbreviations and shorthand."""
+    return _ABBREV_RE.sub(lambda m: _ABBREV_MAP[m.group(1).lower()], text)
+
+
+def _is_spam_or_promotional(text: str) -> bool:
+    """Check if text appears to be spam or promotional content."""
+    # If 2 or more distinct spam indicators, likely spam
+    found_indicators = set()
+    for match in _SPAM_RE.finditer(text.lower()):
+        found_indicators.add(match.lastindex)
+        if len(found_indicators) >= 2:
+            return True
+    
+    return False
+
+
+def _build_mention_lookup(mappings: Dict[str, str]) -> Dict[str, str]:
+    """
+    Flatten a name mapping into {lowercased pattern: standard name}.
+    
+    Variations come first, then standard names, each in mapping order; the
+    first occurrence of a pattern wins.
+    """
+    lookup = {}
+    for pattern, standard_name in list(mappings.items()) + [(name, name) for name in mappings.values()]:
+        lookup.setdefault(pattern.lower(), standard_name)
+    return lookup
+
+
+def _build_mention_automaton(lookup: Dict[str, str]):
+    """
+    Build an Aho-Corasick automaton over a mention lookup.
+    
+    Each pattern stores (priority, standard_name) with priority being its
+    position in the lookup.
+    """
+    automaton = ahocorasick.Automaton()
+    for priority, (pattern, standard_name) in enumerate(lookup.items()):
+        automaton.add_word(pattern, (priority, standard_name))
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_mention(automaton, text_lower: str) -> Optional[str]:
+    """Return the highest-priority standard name mentioned in the text."""
+    best = min((match for _, match in automaton.iter(text_lower)), default=None)
+    return best[1] if best else None
+
+
+def _clean_and_normalize_post(post: Dict[str, Any], text_without_urls: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Clean and normalize a single post.
+    
+    Kept at module level (and synchronous) so it can be shipped to worker
+    processes.
+    
+    Args:
+        post: Raw post dictionary
+        text_without_urls: The post text with URLs already removed (by
+            deduplication), or None to remove them here
+        
+    Returns:
+        Cleaned post dictionary or None if post should be filtered out
+    """
+    try:
+        text = post.get('text', '')
+        if not text:
+            return None
+        
+        # Store original text
+        post['original_text'] = text
+        
+        # URL removal, whitespace collapsing and symbol stripping stay separate
+        # passes: each runs entirely in C, whereas a fused regex needs a Python
+        # replacement callback per match and measured 2-3x slower.
+        
+        # Remove URLs (already done during deduplication for most posts)
+        text = text_without_urls if text_without_urls is not None else _URL_RE.sub('', text)
+        
+        # Remove excessive whitespace
+        text = _WS_RE.sub(' ', text).strip()
+        
+        if text.isascii():
+            # Fast path: ASCII-only text (most English tweets) has no emojis or
+            # Indic script, so only ASCII symbols need stripping
+            found_emojis = []
+            text = text.translate(_ASCII_STRIP_TABLE)
+        else:
+            # Extract water/disaster related emojis (each kept once, in order of appearance)
+            found_emojis = list(dict.fromkeys(_WATER_EMOJI_RE.findall(text)))
+            
+            # Remove all emojis except disaster-related ones
+            text = _EMOJI_STRIP_RE.sub('', text)
+        
+        # Add back important emojis
+        if found_emojis:
+            text += ' ' + ' '.join(found_emojis)
+        
+        # Normalize common abbreviations
+        text = _normalize_abbreviations(text)
+        
+        # Update cleaned text
+        post['cleaned_text'] = text
+        
+        # Filter out posts that are too short after cleaning
+        if len(text.strip()) < 5:
+            return None
+        
+        # Filter out obvious spam or promotional content
+        if _is_spam_or_promotional(text):
+            return None
+        
+        return post
+        
+    except Exception as e:
+        logger.error(f"Error cleaning post {post.get('id')}: {str(e)}")
+        return None
+
+
+def _clean_batch(posts: List[Dict[str, Any]], texts_without_urls: List[Optional[str]]) -> List[Dict[str, Any]]:
+    """Clean a list of posts (with their URL-stripped texts), dropping the ones that are filtered out."""
+    return [post for post in map(_clean_and_normalize_post, posts, texts_without_urls) if post]
+
+
+@functools.lru_cache(maxsize=1)
+def _cleaning_pool() -> ProcessPoolExecutor:
+    """
+    Get the long-lived process pool for cleaning large batches.
+    
+    Workers are spawned rather than forked: the pool is created from a
+    process that already runs threads, and a forked child can inherit a
+    lock held by one of them.
+    """
+    pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+    atexit.register(pool.shutdown, wait=False)
+    return pool
+
+
 class PreprocessingService:
     """Handles preprocessing of raw social media posts."""
     
@@ -20,6 +249,13 @@ class PreprocessingService:
         """Initialize the preprocessing service."""
         self.geolocator = Nominatim(user_agent="social-media-analytics-agent")
         
+        # Nearby geotags (~100 m, 3 decimal places) share one Nominatim lookup
+        self._reverse_geocode_cached = functools.lru_cache(maxsize=8192)(self._reverse_geocode)
+        self._nominatim_lock = threading.Lock()
+        
+        # Posts geocoded to the same place share one address parse
+        self._parse_address_cached = functools.lru_cache(maxsize=4096)(self._parse_address)
+        
         # Common Indian city name mappings
         self.city_mappings = {
             # Common variations and abbreviations
@@ -68,6 +304,30 @@ class PreprocessingService:
             'KL': 'Kerala'
         }
         
+        # Known city/state names and variations for address parsing
+        self._city_names = set(self.city_mappings) | set(self.city_mappings.values())
+        self._state_names = set(self.state_mappings) | set(self.state_mappings.values())
+        
+        # Lowercased city/state patterns, precomputed for mention matching
+        self._city_lookup = _build_mention_lookup(self.city_mappings)
+        self._state_lookup = _build_mention_lookup(self.state_mappings)
+        
+        # Single-pass matchers for city/state mentions in post text
+        if AHOCORASICK_AVAILABLE:
+            self._city_automaton = _build_mention_automaton(self._city_lookup)
+            self._state_automaton = _build_mention_automaton(self._state_lookup)
+        else:
+            self._city_automaton = None
+            self._state_automaton = None
+        
+        # Batch language identification model (lid.176.ftz)
+        self.language_model = None
+        language_model_path = os.getenv('FASTTEXT_LID_MODEL', 'lid.176.ftz')
+        if FASTTEXT_AVAILABLE and os.path.exists(language_model_path):
+            self.language_model = fasttext.load_model(language_model_path)
+        else:
+            logger.warning("fastText language model not available. Falling back to langdetect.")
+        
         logger.info("Preprocessing service initialized")
     
     async def process_posts(self, raw_posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -83,28 +343,40 @@ class PreprocessingService:
         logger.info(f"Starting preprocessing of {len(raw_posts)} raw posts")
         
         # Step 1: Deduplicate posts
-        deduplicated_posts = self._deduplicate_posts(raw_posts)
+        deduplicated_posts, texts_without_urls = self._deduplicate_posts(raw_posts)
         logger.info(f"After deduplication: {len(deduplicated_posts)} posts")
         
-        # Step 2: Clean and normalize text
-        cleaned_posts = []
-        for post in deduplicated_posts:
-            cleaned_post = await self._clean_and_normalize_post(post)
-            if cleaned_post:  # Only keep posts that pass cleaning
-                cleaned_posts.append(cleaned_post)
+        # Step 2: Clean and normalize text (CPU-bound, so large batches use all
+        # cores without blocking the event loop)
+        if len(deduplicated_posts) >= PARALLEL_CLEANING_MIN_POSTS:
+            loop = asyncio.get_running_loop()
+            pool = _cleaning_pool()
+            cleaned_chunks = await asyncio.gather(*[
+                loop.run_in_executor(pool, _clean_batch,
+                                     deduplicated_posts[i:i + PARALLEL_CLEANING_CHUNK_SIZE],
+                                     texts_without_urls[i:i + PARALLEL_CLEANING_CHUNK_SIZE])
+                for i in range(0, len(deduplicated_posts), PARALLEL_CLEANING_CHUNK_SIZE)
+            ])
+            cleaned_posts = [post for chunk in cleaned_chunks for post in chunk]
+        else:
+            cleaned_posts = _clean_batch(deduplicated_posts, texts_without_urls)
         
         logger.info(f"After cleaning: {len(cleaned_posts)} posts")
         
+        # Detect languages for the whole batch at once
+        self._detect_languages(cleaned_posts)
+        
         # Step 3: Infer locations
-        located_posts = []
-        for post in cleaned_posts:
-            located_post = await self._infer_location(post)
-            located_posts.append(located_post)
+        geotag_locations = self._reverse_geocode_batch(cleaned_posts)
+        located_posts = await asyncio.gather(*[
+            self._infer_location(post, geotag_location)
+            for post, geotag_location in zip(cleaned_posts, geotag_locations)
+        ])
         
         logger.info(f"Preprocessing complete: {len(located_posts)} posts")
         return located_posts
     
-    def _deduplicate_posts(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _deduplicate_posts(self, posts: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Remove duplicate and near-duplicate posts.
         
@@ -112,159 +384,138 @@ class PreprocessingService:
             posts: List of raw posts
             
         Returns:
-            List of deduplicated posts
+            Tuple of (deduplicated posts, their texts with URLs removed).
+            Posts are shallow copies: later steps modify them, and callers
+            keep the originals as raw posts.
         """
-        # Create DataFrame for easier deduplication
-        df = pd.DataFrame(posts)
-        
-        # Remove exact text duplicates
-        df = df.drop_duplicates(subset=['text'], keep='first')
-        
-        # Remove retweets and quoted tweets (basic detection)
-        df = df[~df['text'].str.startswith('RT @', na=False)]
-        df = df[~df['text'].str.contains(r'^".*" — @\w+', na=False, regex=True)]
+        seen = set()
+        deduplicated = []
+        texts_without_urls = []
         
-        # Remove posts that are too short (likely not informative)
-        df = df[df['text'].str.len() >= 10]
-        
-        # Remove posts that are mostly URLs or mentions
-        def is_mostly_links_or_mentions(text):
-            if not isinstance(text, str):
-                return True
+        for post in posts:
+            text = post.get('text')
             
-            # Count URLs and mentions
-            url_count = len(re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', text))
-            mention_count = len(re.findall(r'@\w+', text))
+            # Drop missing and too-short texts (likely not informative)
+            if not isinstance(text, str) or len(text) < 10:
+                continue
             
-            # Remove @ and URLs from text to count meaningful content
-            clean_text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-            clean_text = re.sub(r'@\w+', '', clean_text)
-            clean_text = clean_text.strip()
+            # Remove exact text duplicates
+            if text in seen:
+                continue
+            seen.add(text)
             
-            # If more than 50% is URLs/mentions, filter out
-            return len(clean_text) < len(text) * 0.5
-        
-        df = df[~df['text'].apply(is_mostly_links_or_mentions)]
+            # Remove retweets and quoted tweets (basic detection)
+            if _RETWEET_RE.match(text):
+                continue
+            
+            # Remove posts that are mostly URLs or mentions (more than 50% of the text)
+            without_urls, meaningful_text = _strip_links_and_mentions(text)
+            if len(meaningful_text) < len(text) * 0.5:
+                continue
+            
+            deduplicated.append(dict(post))
+            # Reused by the cleaning step instead of running the URL regex again
+            texts_without_urls.append(without_urls)
         
-        return df.to_dict('records')
+        return deduplicated, texts_without_urls
     
-    async def _clean_and_normalize_post(self, post: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """
-        Clean and normalize a single post.
+    def _detect_languages(self, posts: List[Dict[str, Any]]) -> None:
+        """Set 'detected_language' on each cleaned post."""
+        texts = [post['cleaned_text'] for post in posts]
         
-        Args:
-            post: Raw post dictionary
-            
-        Returns:
-            Cleaned post dictionary or None if post should be filtered out
-        """
-        try:
-            text = post.get('text', '')
-            if not text:
-                return None
-            
-            # Store original text
-            post['original_text'] = text
-            
-            # Remove URLs
-            text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-            
-            # Remove excessive whitespace
-            text = re.sub(r'\s+', ' ', text).strip()
-            
-            # Remove or normalize emojis (keep some flood/water related ones)
-            water_emojis = ['🌊', '💧', '🌧️', '⛈️', '🌀', '⚠️', '🚨', '🆘']
-            
-            # Extract water/disaster related emojis
-            found_emojis = []
-            for emoji in water_emojis:
-                if emoji in text:
-                    found_emojis.append(emoji)
-            
-            # Remove all emojis except disaster-related ones
-            text = re.sub(r'[^\w\s\u0900-\u097F\u0980-\u09FF\u0A00-\u0A7F\u0A80-\u0AFF\u0B00-\u0B7F\u0B80-\u0BFF\u0C00-\u0C7F\u0C80-\u0CFF\u0D00-\u0D7F#@.,!?:;()-]', '', text)
-            
-            # Add back important emojis
-            if found_emojis:
-                text += ' ' + ' '.join(found_emojis)
-            
-            # Normalize common abbreviations
-            text = self._normalize_abbreviations(text)
-            
-            # Detect language
+        if self.language_model is not None and texts:
+            labels, _ = self.language_model.predict(texts, k=1)
+            for post, label in zip(posts, labels):
+                post['detected_language'] = label[0].replace('__label__', '') if label else 'unknown'
+            return
+        
+        for post, text in zip(posts, texts):
             try:
-                detected_lang = detect(text)
-                post['detected_language'] = detected_lang
+                post['detected_language'] = detect(text)
             except LangDetectException:
                 post['detected_language'] = 'unknown'
-            
-            # Update cleaned text
-            post['cleaned_text'] = text
-            
-            # Filter out posts that are too short after cleaning
-            if len(text.strip()) < 5:
-                return None
-            
-            # Filter out obvious spam or promotional content
-            if self._is_spam_or_promotional(text):
+    
+    def _reverse_geocode(self, lat: float, lon: float):
+        """Reverse geocode coordinates with Nominatim (wrapped by an LRU cache)."""
+        # Lookups run in executor threads; Nominatim's usage policy allows
+        # only one request at a time
+        with self._nominatim_lock:
+            return self.geolocator.reverse((lat, lon), timeout=5)
+    
+    def _get_geotag_coordinates(self, post: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+        """Return (lat, lon) from a post's geotag, if it has one."""
+        geo = post.get('geo')
+        if geo and isinstance(geo, dict) and 'coordinates' in geo:
+            try:
+                return float(geo['coordinates'][1]), float(geo['coordinates'][0])  # lat, lon order
+            except (IndexError, TypeError, ValueError):
                 return None
-            
-            return post
-            
-        except Exception as e:
-            logger.error(f"Error cleaning post {post.get('id')}: {str(e)}")
-            return None
+        return None
     
-    def _normalize_abbreviations(self, text: str) -> str:
-        """Normalize common abbreviations and shorthand."""
-        # Common text speak normalizations
-        normalizations = {
-            r'\bu\b': 'you',
-            r'\bur\b': 'your',
-            r'\br\b': 'are',
-            r'\bn\b': 'and',
-            r'\bw/\b': 'with',
-            r'\bw/o\b': 'without',
-            r'\btho\b': 'though',
-            r'\bthru\b': 'through',
-            r'\bcoz\b': 'because',
-            r'\bbcoz\b': 'because',
-        }
+    def _reverse_geocode_batch(self, posts: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resolve the geotags of a batch of posts with one offline lookup.
         
-        for pattern, replacement in normalizations.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        Args:
+            posts: Cleaned post dictionaries
+            
+        Returns:
+            List aligned with posts holding a location dict or None; all None
+            when reverse_geocoder is not installed or the lookup fails, in
+            which case _infer_location falls back to Nominatim.
+        """
+        locations = [None] * len(posts)
+        if not REVERSE_GEOCODER_AVAILABLE:
+            return locations
         
-        return text
-    
-    def _is_spam_or_promotional(self, text: str) -> bool:
-        """Check if text appears to be spam or promotional content."""
-        spam_indicators = [
-            r'buy now',
-            r'click here',
-            r'limited time',
-            r'call now',
-            r'visit our website',
-            r'download app',
-            r'free download',
-            r'get \d+% off',
-            r'subscribe to',
-            r'follow us',
-            r'like and share',
-            r'dm for'
+        indexed_coordinates = [
+            (i, coordinates) for i, post in enumerate(posts)
+            if (coordinates := self._get_geotag_coordinates(post))
         ]
+        if not indexed_coordinates:
+            return locations
         
-        text_lower = text.lower()
-        spam_count = sum(1 for pattern in spam_indicators if re.search(pattern, text_lower))
+        try:
+            # mode=1 queries in this process; the default mode=2 forks worker
+            # processes (unsafe from a threaded server) and verbose prints to stdout
+            results = reverse_geocoder.search([coordinates for _, coordinates in indexed_coordinates],
+                                              mode=1, verbose=False)
+        except Exception as e:
+            logger.debug(f"Error reverse geocoding batch: {str(e)}")
+            return locations
         
-        # If more than 2 spam indicators, likely spam
-        return spam_count >= 2
+        for (i, (lat, lon)), result in zip(indexed_coordinates, results):
+            address = ', '.join(part for part in (result.get('name'), result.get('admin2'), result.get('admin1')) if part)
+            if not address:
+                continue
+            
+            # Same city/state normalization as Nominatim addresses; GeoNames
+            # names are title-cased, so also match the lowercase mapping keys
+            city, state = self._parse_address_cached(address)
+            if city:
+                city = self.city_mappings.get(city.lower(), city)
+            locations[i] = {
+                'latitude': lat,
+                'longitude': lon,
+                'address': address,
+                'city': city,
+                'state': state or result.get('admin1') or None,
+                'country': 'India'
+            }
+        
+        return locations
     
-    async def _infer_location(self, post: Dict[str, Any]) -> Dict[str, Any]:
+    async def _infer_location(
+        self,
+        post: Dict[str, Any],
+        geotag_location: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Infer location from post content and geotag.
         
         Args:
             post: Cleaned post dictionary
+            geotag_location: Geotag already resolved by _reverse_geocode_batch
             
         Returns:
             Post dictionary with inferred location
@@ -272,20 +523,28 @@ class PreprocessingService:
         inferred_location = None
         confidence = 0.0
         
-        # Priority 1: Use existing geotag if available
-        if post.get('geo') and isinstance(post['geo'], dict):
-            geo = post['geo']
-            if 'coordinates' in geo:
+        # Priority 1: Use existing geotag if available, resolved offline when
+        # possible and by Nominatim otherwise
+        if geotag_location:
+            inferred_location = geotag_location
+            confidence = 1.0
+        else:
+            coordinates = self._get_geotag_coordinates(post)
+            if coordinates:
                 try:
-                    lat, lon = geo['coordinates'][1], geo['coordinates'][0]  # lat, lon order
-                    location = self.geolocator.reverse((lat, lon), timeout=5)
+                    lat, lon = coordinates
+                    loop = asyncio.get_running_loop()
+                    location = await loop.run_in_executor(
+                        None, self._reverse_geocode_cached, round(lat, 3), round(lon, 3)
+                    )
                     if location:
+                        city, state = self._parse_address_cached(location.address)
                         inferred_location = {
                             'latitude': lat,
                             'longitude': lon,
                             'address': location.address,
-                            'city': self._extract_city_from_address(location.address),
-                            'state': self._extract_state_from_address(location.address),
+                            'city': city,
+                            'state': state,
                             'country': 'India'
                         }
                         confidence = 1.0
@@ -305,6 +564,10 @@ class PreprocessingService:
         
         return post
     
+    def _parse_address(self, address: str) -> Tuple[Optional[str], Optional[str]]:
+        """Extract (city, state) from a geocoded address (wrapped by an LRU cache)."""
+        return self._extract_city_from_address(address), self._extract_state_from_address(address)
+    
     def _extract_city_from_address(self, address: str) -> Optional[str]:
         """Extract city name from geocoded address."""
         if not address:
@@ -314,7 +577,7 @@ class PreprocessingService:
         parts = address.split(', ')
         for part in parts:
             part = part.strip()
-            if part in self.city_mappings.values() or part in self.city_mappings.keys():
+            if part in self._city_names:
                 return self.city_mappings.get(part, part)
         
         return parts[0] if parts else None
@@ -327,11 +590,19 @@ class PreprocessingService:
         parts = address.split(', ')
         for part in parts:
             part = part.strip()
-            if part in self.state_mappings.values() or part in self.state_mappings.keys():
+            if part in self._state_names:
                 return self.state_mappings.get(part, part)
         
         return None
     
+    def _scan_lookup(self, lookup: Dict[str, str], text_lower: str) -> Optional[str]:
+        """Find a mentioned name in text by substring scans (no Aho-Corasick)."""
+        for pattern, standard_name in lookup.items():
+            if pattern in text_lower:
+                return standard_name
+        
+        return None
+    
     def _extract_location_from_text(self, text: str) -> Optional[Dict[str, Any]]:
         """Extract location information from text content."""
         if not text:
@@ -339,35 +610,13 @@ class PreprocessingService:
         
         text_lower = text.lower()
         
-        # Look for city mentions
-        found_city = None
-        found_state = None
-        
-        # Check for city names (including variations)
-        for variation, standard_name in self.city_mappings.items():
-            if variation.lower() in text_lower:
-                found_city = standard_name
-                break
-        
-        # If no variation found, check standard names
-        if not found_city:
-            for city in self.city_mappings.values():
-                if city.lower() in text_lower:
-                    found_city = city
-                    break
-        
-        # Check for state names
-        for variation, standard_name in self.state_mappings.items():
-            if variation.lower() in text_lower:
-                found_state = standard_name
-                break
-        
-        # If no variation found, check standard names
-        if not found_state:
-            for state in self.state_mappings.values():
-                if state.lower() in text_lower:
-                    found_state = state
-                    break
+        # Look for city and state mentions
+        if self._city_automaton is not None:
+            found_city = _first_mention(self._city_automaton, text_lower)
+            found_state = _first_mention(self._state_automaton, text_lower)
+        else:
+            found_city = self._scan_lookup(self._city_lookup, text_lower)
+            found_state = self._scan_lookup(self._state_lookup, text_lower)
         
         if found_city or found_state:
             return {
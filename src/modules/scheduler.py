@@ -3,11 +3,9 @@ Scheduler Service
 Manages the hourly batch job scheduling for the social media analytics agent.
 """
 
-import time
-import schedule
 import threading
 from loguru import logger
-from datetime import datetime
+from datetime import datetime, timedelta
 
 class SchedulerService:
     """Handles job scheduling and execution."""
@@ -16,20 +14,33 @@ class SchedulerService:
         """Initialize the scheduler service."""
         self.running = False
         self.scheduler_thread = None
+        self.jobs = []
+        self._jobs_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Set to make the scheduler thread re-read the job list (new job or stop)
+        self._wake_event = threading.Event()
         logger.info("Scheduler service initialized")
     
     def schedule_hourly_job(self, job_func, interval_seconds=3600):
         """
         Schedule a job to run at regular intervals.
         
+        May be called before or after start(); a running scheduler picks the
+        new job up immediately.
+        
         Args:
             job_func: The function to execute
             interval_seconds: Interval between executions (default 1 hour)
         """
-        interval_minutes = interval_seconds // 60
-        
-        schedule.every(interval_minutes).minutes.do(job_func)
-        logger.info(f"Scheduled job to run every {interval_minutes} minutes")
+        job = {
+            'func': job_func,
+            'interval_seconds': interval_seconds,
+            'next_run': datetime.now() + timedelta(seconds=interval_seconds)
+        }
+        with self._jobs_lock:
+            self.jobs.append(job)
+        self._wake_event.set()
+        logger.info(f"Scheduled job to run every {interval_seconds // 60} minutes")
     
     def start(self):
         """Start the scheduler in a separate thread."""
@@ -38,6 +49,7 @@ class SchedulerService:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.scheduler_thread = threading.Thread(target=self._run_scheduler)
         self.scheduler_thread.daemon = True
         self.scheduler_thread.start()
@@ -47,32 +59,54 @@ class SchedulerService:
     def stop(self):
         """Stop the scheduler."""
         self.running = False
+        self._stop_event.set()
+        self._wake_event.set()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
         
-        schedule.clear()
+        with self._jobs_lock:
+            self.jobs.clear()
         logger.info("Scheduler stopped")
     
     def _run_scheduler(self):
-        """Internal method to run the scheduler loop."""
+        """
+        Internal method to run the scheduler loop.
+        
+        Sleeps until the earliest job is due instead of polling, and wakes
+        immediately when a job is added or the scheduler is stopped.
+        """
         logger.info("Scheduler thread started")
         
         while self.running:
+            next_run = self.get_next_run_time()
+            delay = None if next_run is None else max((next_run - datetime.now()).total_seconds(), 0)
+            
+            self._wake_event.wait(timeout=delay)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            
+            self._run_due_jobs()
+        
+        logger.info("Scheduler thread stopped")
+    
+    def _run_due_jobs(self):
+        """Run every job whose next run time has passed and reschedule it."""
+        with self._jobs_lock:
+            due_jobs = [job for job in self.jobs if job['next_run'] <= datetime.now()]
+        
+        for job in due_jobs:
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                job['func']()
+                job['next_run'] = datetime.now() + timedelta(seconds=job['interval_seconds'])
             except Exception as e:
                 logger.error(f"Error in scheduler thread: {str(e)}", exc_info=True)
-                time.sleep(60)  # Wait 1 minute before retrying
-        
-        logger.info("Scheduler thread stopped")
+                job['next_run'] = datetime.now() + timedelta(minutes=1)  # Wait 1 minute before retrying
     
     def get_next_run_time(self):
-        """Get the next scheduled run time."""
-        jobs = schedule.get_jobs()
-        if jobs:
-            return jobs[0].next_run
-        return None
+        """Get the next scheduled run time (earliest across jobs), or None."""
+        with self._jobs_lock:
+            return min((job['next_run'] for job in self.jobs), default=None)
     
     def run_now(self, job_func):
         """Run a job immediately (for testing purposes)."""
@@ -4,12 +4,12 @@ Handles database operations for storing batch results and analytics data.
 """
 
 import os
-import json
 import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from loguru import logger
 import uuid
+import orjson
 
 class StorageService:
     """Handles data storage and retrieval."""
@@ -51,10 +51,18 @@ class StorageService:
         
         # Store to file for development
         filename = f"data/processed/batch_{batch_id}.json"
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(batch_data, f, indent=2, ensure_ascii=False)
+        # Serialize and write off the event loop so other awaits keep running
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_batch_file, filename, batch_data)
         
         logger.info(f"Batch results stored to {filename}")
         return batch_id
+    
+    def _write_batch_file(self, filename: str, batch_data: Dict[str, Any]) -> None:
+        """Write batch data to a JSON file (blocking; run in an executor)."""
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        
+        # Compact output: indentation roughly doubled the file size
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(batch_data))
@@ -0,0 +1,47 @@
+"""
+In-memory stand-ins for external clients, used when COASTAL_OFFLINE is set.
+
+They let the test scripts exercise the alert pipeline end to end without
+network I/O: every request "succeeds" immediately with a deterministic SID.
+"""
+
+import hashlib
+from types import SimpleNamespace
+
+
+def _fake_sid(prefix: str, *parts) -> str:
+    """Build a Twilio-shaped SID (prefix + 32 hex chars) that is stable across runs."""
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return prefix + digest
+
+
+class _FakeResource:
+    """Mimics ``client.messages`` / ``client.calls``: sync and async ``create``."""
+
+    def __init__(self, sid_prefix: str):
+        self.sid_prefix = sid_prefix
+        self.created = []
+
+    def create(self, **kwargs) -> SimpleNamespace:
+        self.created.append(kwargs)
+        sid = _fake_sid(self.sid_prefix, kwargs.get('to'), len(self.created))
+        return SimpleNamespace(sid=sid, status='queued', to=kwargs.get('to'))
+
+    async def create_async(self, **kwargs) -> SimpleNamespace:
+        return self.create(**kwargs)
+
+
+class _FakeHttpClient:
+    """The bit of Twilio's http client the service touches: close()."""
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeTwilioClient:
+    """Drop-in for ``twilio.rest.Client`` that records requests instead of sending them."""
+
+    def __init__(self):
+        self.messages = _FakeResource('SM')
+        self.calls = _FakeResource('CA')
+        self.http_client = _FakeHttpClient()
@@ -4,13 +4,30 @@ Handles SMS and voice call notifications for emergency alerts.
 """
 
 import os
+import re
 import json
+import time
+import random
+import asyncio
+import functools
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from twilio.rest import Client
-from twilio.base.exceptions import TwilioException
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, AsyncIterator, List, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple
 from loguru import logger
 
+# The Twilio SDK is imported on first use (see _twilio()), so importing this
+# module stays cheap when alerts are not configured
+if TYPE_CHECKING:
+    from twilio.rest import Client
+
+# phonenumbers gives proper E.164 validation; a digit-count heuristic is the fallback
+try:
+    import phonenumbers
+    PHONENUMBERS_AVAILABLE = True
+except ImportError:
+    PHONENUMBERS_AVAILABLE = False
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -18,28 +35,332 @@ try:
 except ImportError:
     pass  # dotenv not available, environment variables should be set externally
 
+_NON_DIGIT_RE = re.compile(r'\D+')
+
+# XML escaping for text embedded in TwiML
+_XML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&apos;'})
+
+# Maximum in-flight Twilio requests during bulk alerts (Twilio rejects more than
+# 100 concurrent API requests per account)
+BULK_MAX_CONCURRENCY = 50
+
+# Retry policy for throttled (429) and unavailable (503) responses. Both mean
+# Twilio did not act on the request; a 500 may come after the message or call
+# was already created, so retrying it could alert someone twice.
+RETRYABLE_STATUS_CODES = {429, 503}
+RETRY_MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Resends for connections that failed before the request was sent
+CONNECT_RETRIES = 2
+
+# HTTP timeout (seconds) for each Twilio API request, so a stalled TLS handshake
+# or slow carrier response cannot hang an alert run
+TWILIO_HTTP_TIMEOUT = 10.0
+
+# Timeout (seconds) for the background request that pre-opens the TLS connection
+WARMUP_TIMEOUT = 5.0
+
+# Total time (seconds) one bulk recipient may take, retries included
+BULK_TIMEOUT_BUDGET = 15.0
+
+# Optional client-side pacing for the async/streaming bulk APIs, in requests
+# per second. Off (0) by default: Twilio queues messages and calls on its side,
+# and the synchronous wrappers used by request handlers never pace.
+SMS_MESSAGES_PER_SECOND = float(os.getenv('TWILIO_SMS_MPS', '0'))
+VOICE_CALLS_PER_SECOND = float(os.getenv('TWILIO_VOICE_CPS', '0'))
+RATE_LIMIT_BURST = 5
+
+# COASTAL_OFFLINE=1 swaps the Twilio client for an in-memory fake (see
+# services/_fakes.py) so test runs never touch the network
+OFFLINE_MODE = os.getenv('COASTAL_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+# Alert timestamps have minute resolution; cache the formatted string per minute
+_ts_cache = {'key': -1, 'value': ''}
+
+
+def _current_minute_timestamp() -> str:
+    """Return the current local time as 'YYYY-MM-DD HH:MM', formatted once per minute."""
+    minute = int(time.time() // 60)
+    if minute != _ts_cache['key']:
+        _ts_cache['value'] = datetime.fromtimestamp(minute * 60).strftime('%Y-%m-%d %H:%M')
+        _ts_cache['key'] = minute
+    return _ts_cache['value']
+
+
+@functools.lru_cache(maxsize=1)
+def _twilio() -> SimpleNamespace:
+    """Import the Twilio SDK classes this service uses, once, on first use."""
+    from twilio.rest import Client
+    from twilio.http.http_client import TwilioHttpClient
+    from twilio.http.async_http_client import AsyncTwilioHttpClient
+    from twilio.base.exceptions import TwilioException, TwilioRestException
+    return SimpleNamespace(
+        Client=Client,
+        TwilioHttpClient=TwilioHttpClient,
+        AsyncTwilioHttpClient=AsyncTwilioHttpClient,
+        TwilioException=TwilioException,
+        TwilioRestException=TwilioRestException,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _twilio_config() -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """Read (account SID, auth token, phone number, TwiML app SID) from the environment once."""
+    return (
+        os.getenv('TWILIO_ACCOUNT_SID'),
+        os.getenv('TWILIO_AUTH_TOKEN'),
+        os.getenv('TWILIO_PHONE_NUMBER'),
+        os.getenv('TWILIO_TWIML_APP_SID'),  # For voice calls
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_client(account_sid: str, auth_token: str) -> 'Client':
+    """
+    Get the Twilio client for a set of credentials.
+    
+    Every TwilioAlertService with the same credentials reuses one client and
+    so one keep-alive connection pool.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    # Only failed connects are retried here: the request never reached Twilio,
+    # so even a POST is safe to resend. Status retries (429/503) stay in
+    # _with_retry so they honour Retry-After.
+    connect_retry = Retry(total=CONNECT_RETRIES, connect=CONNECT_RETRIES, read=False, status=0,
+                          backoff_factor=0.2)
+    
+    twilio = _twilio()
+    http_client = twilio.TwilioHttpClient(pool_connections=True, timeout=TWILIO_HTTP_TIMEOUT)
+    http_client.session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=connect_retry))
+    return twilio.Client(account_sid, auth_token, http_client=http_client)
+
+
+class _TokenBucket:
+    """Asyncio token bucket that paces requests to a steady rate (a rate of 0 disables pacing)."""
+    
+    def __init__(self, rate: float, burst: int = RATE_LIMIT_BURST):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+@functools.lru_cache(maxsize=65536)
+def _format_phone_number_cached(phone_number: str) -> Optional[str]:
+    """
+    Format a phone number to E.164.
+    
+    Normalization is pure, so results are memoized; repeat campaigns to the
+    same subscribers skip parsing entirely.
+    
+    Args:
+        phone_number: Raw phone number string
+        
+    Returns:
+        Formatted phone number or None if invalid
+    """
+    if not phone_number:
+        return None
+    
+    # Numbers without a country code are treated as Indian
+    if PHONENUMBERS_AVAILABLE:
+        try:
+            parsed = phonenumbers.parse(phone_number, 'IN')
+        except phonenumbers.NumberParseException:
+            return None
+        if not phonenumbers.is_valid_number(parsed):
+            return None
+        return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+    
+    # Remove all non-digit characters
+    digits = _NON_DIGIT_RE.sub('', phone_number)
+    
+    # Handle Indian phone numbers (add +91 prefix if needed)
+    if len(digits) == 10 and digits.startswith(('9', '8', '7', '6')):
+        return f"+91{digits}"
+    elif len(digits) >= 10:
+        return f"+{digits}"
+    
+    return None
+
+
+class AlertResult(NamedTuple):
+    """One recipient's outcome from a bulk alert run."""
+    recipient: str
+    phone: Optional[str]
+    status: str
+    sid: Optional[str]
+    error: Optional[str]
+
+
+def iter_results(results: Dict) -> Iterator[AlertResult]:
+    """
+    Yield per-recipient AlertResult rows from a bulk alert result.
+    
+    Rows are tuples built straight from the result columns, so reporting code
+    can walk large campaigns without materializing a dict per recipient.
+    
+    Args:
+        results: Result of send_bulk_sms_alerts or make_bulk_voice_alerts
+        
+    Yields:
+        AlertResult for each recipient, in recipient order
+    """
+    return map(AlertResult._make, zip(results['recipients'], results['phones'],
+                                      results['statuses'], results['ids'], results['errors']))
+
+
+def details_iter(results: Dict) -> Iterator[Dict]:
+    """
+    Yield per-recipient detail dicts from a bulk alert result.
+    
+    Bulk results are stored column-wise; this builds dict rows lazily for
+    callers that expect the older per-recipient detail format.
+    
+    Args:
+        results: Result of send_bulk_sms_alerts or make_bulk_voice_alerts
+        
+    Yields:
+        Dict with 'recipient', 'phone', 'status' and either the Twilio SID
+        (under results['id_key']) or 'error'
+    """
+    id_key = results['id_key']
+    for row in iter_results(results):
+        detail = {'recipient': row.recipient, 'phone': row.phone, 'status': row.status}
+        if row.sid is not None:
+            detail[id_key] = row.sid
+        else:
+            detail['error'] = row.error
+        yield detail
+
+
+def summarize_bulk_results(results: Dict) -> Dict:
+    """
+    Convert a column-wise bulk alert result to the per-recipient format.
+    
+    This is the shape the admin alert API returns and stores in
+    alert_broadcasts.broadcast_details, so use it at those boundaries.
+    
+    Args:
+        results: Result of send_bulk_sms_alerts or make_bulk_voice_alerts
+        
+    Returns:
+        Dict with 'total', 'successful', 'failed' and a 'details' list
+    """
+    return {
+        'total': results['total'],
+        'successful': results['successful'],
+        'failed': results['failed'],
+        'details': list(details_iter(results))
+    }
+
+
+# Predefined alert templates by "<hazard>_<severity>" key (read-only)
+_ALERT_TEMPLATES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    key: MappingProxyType(messages) for key, messages in {
+        'flood_high': {
+            'sms': "URGENT: Severe flooding detected. Immediate evacuation may be required. Avoid flooded roads and seek higher ground.",
+            'voice': "Urgent flood alert. Severe flooding has been detected in your area. Immediate evacuation may be required. Please avoid flooded roads and seek higher ground immediately."
+        },
+        'flood_medium': {
+            'sms': "WARNING: Flooding reported in your area. Exercise caution, monitor conditions, and be prepared to evacuate if necessary.",
+            'voice': "Flood warning. Flooding has been reported in your area. Please exercise caution, monitor local conditions, and be prepared to evacuate if conditions worsen."
+        },
+        'tsunami_high': {
+            'sms': "TSUNAMI ALERT: Move to higher ground immediately. This is not a drill. Follow evacuation routes and official emergency instructions.",
+            'voice': "This is a tsunami alert. Move to higher ground immediately. This is not a drill. Please follow designated evacuation routes and listen to official emergency instructions."
+        },
+        'storm_surge_high': {
+            'sms': "STORM SURGE WARNING: Dangerous coastal flooding expected. Evacuate low-lying areas immediately. Do not attempt to travel through flood waters.",
+            'voice': "Storm surge warning. Dangerous coastal flooding is expected in your area. Please evacuate low-lying areas immediately. Do not attempt to travel through flood waters."
+        },
+        'general_high': {
+            'sms': "EMERGENCY ALERT: Serious coastal hazard detected in your area. Follow local emergency instructions and stay informed through official channels.",
+            'voice': "Emergency alert. A serious coastal hazard has been detected in your area. Please follow local emergency instructions and stay informed through official channels."
+        },
+        'general_medium': {
+            'sms': "HAZARD ALERT: Coastal hazard conditions detected. Monitor local conditions and be prepared to take action if advised by authorities.",
+            'voice': "Hazard alert. Coastal hazard conditions have been detected in your area. Please monitor local conditions and be prepared to take action if advised by authorities."
+        }
+    }.items()
+})
+
+# The same templates keyed by (hazard, severity, channel) for single-lookup access
+_FLAT_TEMPLATES: Dict[Tuple[str, str, str], str] = {
+    (hazard, severity, channel): body
+    for key, messages in _ALERT_TEMPLATES.items()
+    for hazard, severity in [key.rsplit('_', 1)]
+    for channel, body in messages.items()
+}
+
 
 class TwilioAlertService:
-    """Service for sending SMS and voice alerts via Twilio."""
+    """
+    Service for sending SMS and voice alerts via Twilio.
+    
+    Use the module-level ``twilio_service`` instance rather than constructing
+    new ones, so all alerts share one pooled HTTPS session to api.twilio.com.
+    """
     
     def __init__(self):
         """Initialize Twilio client with credentials from environment."""
-        self.account_sid = os.getenv('TWILIO_ACCOUNT_SID')
-        self.auth_token = os.getenv('TWILIO_AUTH_TOKEN')
-        self.phone_number = os.getenv('TWILIO_PHONE_NUMBER')
-        self.twiml_app_sid = os.getenv('TWILIO_TWIML_APP_SID')  # For voice calls
+        self.account_sid, self.auth_token, self.phone_number, self.twiml_app_sid = _twilio_config()
         
-        if not all([self.account_sid, self.auth_token, self.phone_number]):
+        if OFFLINE_MODE:
+            from services._fakes import FakeTwilioClient
+            self.phone_number = self.phone_number or '+15005550006'
+            self.client = FakeTwilioClient()
+            logger.info("COASTAL_OFFLINE set: Twilio alerts go to an in-memory fake client")
+        elif not all([self.account_sid, self.auth_token, self.phone_number]):
             logger.warning("Twilio credentials not properly configured. Alert system will be disabled.")
             self.client = None
         else:
-            self.client = Client(self.account_sid, self.auth_token)
+            self.client = _shared_client(self.account_sid, self.auth_token)
             logger.info("Twilio alert service initialized successfully")
     
     def is_available(self) -> bool:
         """Check if Twilio service is properly configured."""
         return self.client is not None
     
+    def warm_up(self) -> None:
+        """
+        Open the HTTPS connection to api.twilio.com in a background thread.
+        
+        Interactive callers invoke this while waiting on user input, so the
+        TCP and TLS handshakes are done (and the connection sits in the
+        shared pool) by the time the first alert is sent. Failures are
+        ignored; the first real request simply connects as usual.
+        """
+        if not self.is_available() or OFFLINE_MODE:
+            return
+        threading.Thread(target=self._warm_up_connection, name='twilio-warmup', daemon=True).start()
+    
+    def _warm_up_connection(self) -> None:
+        """Issue one cheap request through the shared session to establish a pooled connection."""
+        try:
+            self.client.http_client.session.get('https://api.twilio.com/', timeout=WARMUP_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Twilio connection warm-up failed: {str(e)}")
+    
     def send_sms_alert(self, phone_number: str, message: str, report_data: Dict) -> Tuple[bool, str]:
         """
         Send SMS alert to a phone number.
@@ -65,16 +386,16 @@ class TwilioAlertService:
             alert_message = self._create_sms_message(message, report_data)
             
             # Send SMS
-            message_obj = self.client.messages.create(
+            message_obj = self._with_retry(lambda: self.client.messages.create(
                 body=alert_message,
                 from_=self.phone_number,
                 to=formatted_number
-            )
+            ))
             
             logger.info(f"SMS alert sent to {formatted_number}: {message_obj.sid}")
             return True, message_obj.sid
             
-        except TwilioException as e:
+        except _twilio().TwilioException as e:
             logger.error(f"Twilio SMS error for {phone_number}: {str(e)}")
             return False, str(e)
         except Exception as e:
@@ -102,30 +423,23 @@ class TwilioAlertService:
             if not formatted_number:
                 return False, "Invalid phone number format"
             
-            # Create voice message
-            voice_message = self._create_voice_message(message, report_data)
-            
-            # Escape XML special characters in the voice message
-            escaped_message = voice_message.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&apos;')
-            
-            # Create proper TwiML with multiple Say elements for better delivery
-            twiml = f'<Response><Say voice="alice" language="en">{escaped_message}</Say><Pause length="1"/><Say voice="alice" language="en">This message will now repeat.</Say><Pause length="1"/><Say voice="alice" language="en">{escaped_message}</Say></Response>'
+            twiml = self._create_voice_twiml(self._create_voice_message(message, report_data))
             
             logger.info(f"Making voice call to {formatted_number} with TwiML: {twiml[:100]}...")
             
             # Make voice call
-            call = self.client.calls.create(
+            call = self._with_retry(lambda: self.client.calls.create(
                 twiml=twiml,
                 to=formatted_number,
                 from_=self.phone_number,
                 timeout=30,  # Add timeout to prevent hanging calls
                 record=False  # Don't record the call for privacy
-            )
+            ))
             
             logger.info(f"Voice alert call initiated to {formatted_number}: {call.sid}")
             return True, call.sid
             
-        except TwilioException as e:
+        except _twilio().TwilioException as e:
             error_msg = f"Twilio voice call error for {phone_number}: {str(e)}"
             logger.error(error_msg)
             return False, str(e)
@@ -134,61 +448,113 @@ class TwilioAlertService:
             logger.error(error_msg)
             return False, str(e)
     
+    async def _send_sms_prepared_async(self, client: 'Client', phone_number: str, body: str) -> Tuple[bool, str]:
+        """
+        Send an already formatted SMS without blocking the event loop.
+        
+        Bulk callers check is_available() and format the number once up
+        front, so neither is repeated here.
+        
+        Args:
+            client: Twilio client backed by an AsyncTwilioHttpClient
+            phone_number: Recipient phone number, already in E.164 format
+            body: Complete SMS body
+            
+        Returns:
+            Tuple of (success: bool, message_id_or_error: str)
+        """
+        try:
+            # Send SMS
+            message_obj = await self._with_retry_async(client, lambda: client.messages.create_async(
+                body=body,
+                from_=self.phone_number,
+                to=phone_number
+            ))
+            
+            logger.info(f"SMS alert sent to {phone_number}: {message_obj.sid}")
+            return True, message_obj.sid
+            
+        except _twilio().TwilioException as e:
+            logger.error(f"Twilio SMS error for {phone_number}: {str(e)}")
+            return False, str(e)
+        except Exception as e:
+            logger.error(f"Unexpected SMS error for {phone_number}: {str(e)}")
+            return False, str(e)
+    
+    async def _make_voice_call_prepared_async(self, client: 'Client', phone_number: str, voice_message: str) -> Tuple[bool, str]:
+        """
+        Make a voice call with an already formatted message without blocking
+        the event loop.
+        
+        Bulk callers check is_available() and format the number once up
+        front, so neither is repeated here.
+        
+        Args:
+            client: Twilio client backed by an AsyncTwilioHttpClient
+            phone_number: Recipient phone number, already in E.164 format
+            voice_message: Complete TTS message
+            
+        Returns:
+            Tuple of (success: bool, call_id_or_error: str)
+        """
+        try:
+            twiml = self._create_voice_twiml(voice_message)
+            
+            # Make voice call
+            call = await self._with_retry_async(client, lambda: client.calls.create_async(
+                twiml=twiml,
+                to=phone_number,
+                from_=self.phone_number,
+                timeout=30,  # Add timeout to prevent hanging calls
+                record=False  # Don't record the call for privacy
+            ))
+            
+            logger.info(f"Voice alert call initiated to {phone_number}: {call.sid}")
+            return True, call.sid
+            
+        except _twilio().TwilioException as e:
+            logger.error(f"Twilio voice call error for {phone_number}: {str(e)}")
+            return False, str(e)
+        except Exception as e:
+            logger.error(f"Unexpected voice call error for {phone_number}: {str(e)}")
+            return False, str(e)
+    
     def send_bulk_sms_alerts(self, recipients: List[Dict], message: str, report_data: Dict) -> Dict:
         """
         Send SMS alerts to multiple recipients.
         
+        Synchronous wrapper around send_bulk_sms_alerts_async for callers
+        without an event loop. Sends are not paced, since this runs inside
+        request handlers.
+        
         Args:
             recipients: List of dicts with 'phone_number' and optionally 'name'
             message: Alert message content
             report_data: Report data for context
             
         Returns:
-            Dict with success/failure counts and details
+            Dict with success/failure counts and per-recipient columns
         """
-        results = {
-            'total': len(recipients),
-            'successful': 0,
-            'failed': 0,
-            'details': []
-        }
+        return asyncio.run(self.send_bulk_sms_alerts_async(recipients, message, report_data, rate=0))
+    
+    async def send_bulk_sms_alerts_async(self, recipients: List[Dict], message: str, report_data: Dict,
+                                         rate: float = SMS_MESSAGES_PER_SECOND) -> Dict:
+        """
+        Send SMS alerts to multiple recipients concurrently.
         
-        for recipient in recipients:
-            phone_number = recipient.get('phone_number')
-            name = recipient.get('name', 'Subscriber')
-            
-            if not phone_number:
-                results['failed'] += 1
-                results['details'].append({
-                    'recipient': name,
-                    'phone': phone_number,
-                    'status': 'failed',
-                    'error': 'No phone number provided'
-                })
-                continue
-            
-            # Personalize message if name is available
-            personalized_message = f"Hello {name}, " + message if name != 'Subscriber' else message
-            
-            success, result = self.send_sms_alert(phone_number, personalized_message, report_data)
-            
-            if success:
-                results['successful'] += 1
-                results['details'].append({
-                    'recipient': name,
-                    'phone': phone_number,
-                    'status': 'sent',
-                    'message_id': result
-                })
-            else:
-                results['failed'] += 1
-                results['details'].append({
-                    'recipient': name,
-                    'phone': phone_number,
-                    'status': 'failed',
-                    'error': result
-                })
+        At most BULK_MAX_CONCURRENCY requests are in flight at a time.
         
+        Args:
+            recipients: List of dicts with 'phone_number' and optionally 'name'
+            message: Alert message content
+            report_data: Report data for context
+            rate: Sends per second (0 disables pacing)
+            
+        Returns:
+            Dict with success/failure counts and per-recipient columns (in recipient order)
+        """
+        results = await self._run_bulk_alerts(recipients, message, self._sms_sender(report_data),
+                                             'sent', 'message_id', rate)
         logger.info(f"Bulk SMS sent: {results['successful']}/{results['total']} successful")
         return results
     
@@ -196,89 +562,380 @@ class TwilioAlertService:
         """
         Make voice call alerts to multiple recipients.
         
+        Synchronous wrapper around make_bulk_voice_alerts_async for callers
+        without an event loop. Calls are not paced, since this runs inside
+        request handlers.
+        
         Args:
             recipients: List of dicts with 'phone_number' and optionally 'name'
             message: Alert message content for TTS
             report_data: Report data for context
             
         Returns:
-            Dict with success/failure counts and details
+            Dict with success/failure counts and per-recipient columns
         """
-        results = {
-            'total': len(recipients),
-            'successful': 0,
-            'failed': 0,
-            'details': []
-        }
+        return asyncio.run(self.make_bulk_voice_alerts_async(recipients, message, report_data, rate=0))
+    
+    async def make_bulk_voice_alerts_async(self, recipients: List[Dict], message: str, report_data: Dict,
+                                           rate: float = VOICE_CALLS_PER_SECOND) -> Dict:
+        """
+        Make voice call alerts to multiple recipients concurrently.
         
-        for recipient in recipients:
-            phone_number = recipient.get('phone_number')
-            name = recipient.get('name', 'Subscriber')
-            
-            if not phone_number:
-                results['failed'] += 1
-                results['details'].append({
-                    'recipient': name,
-                    'phone': phone_number,
-                    'status': 'failed',
-                    'error': 'No phone number provided'
-                })
-                continue
-            
-            # Personalize message if name is available
-            personalized_message = f"Hello {name}, " + message if name != 'Subscriber' else message
-            
-            success, result = self.make_voice_call_alert(phone_number, personalized_message, report_data)
-            
-            if success:
-                results['successful'] += 1
-                results['details'].append({
-                    'recipient': name,
-                    'phone': phone_number,
-                    'status': 'called',
-                    'call_id': result
-                })
-            else:
-                results['failed'] += 1
-                results['details'].append({
-                    'recipient': name,
-                    'phone': phone_number,
-                    'status': 'failed',
-                    'error': result
-                })
+        At most BULK_MAX_CONCURRENCY requests are in flight at a time.
         
+        Args:
+            recipients: List of dicts with 'phone_number' and optionally 'name'
+            message: Alert message content for TTS
+            report_data: Report data for context
+            rate: Calls per second (0 disables pacing)
+            
+        Returns:
+            Dict with success/failure counts and per-recipient columns (in recipient order)
+        """
+        results = await self._run_bulk_alerts(recipients, message, self._voice_sender(report_data),
+                                             'called', 'call_id', rate)
         logger.info(f"Bulk voice alerts made: {results['successful']}/{results['total']} successful")
         return results
     
-    def _format_phone_number(self, phone_number: str) -> Optional[str]:
+    def iter_send_bulk_sms_alerts(self, recipients: Iterable[Dict], message: str,
+                                  report_data: Dict) -> AsyncIterator[AlertResult]:
+        """
+        Stream SMS alert results as each send completes.
+        
+        Only BULK_MAX_CONCURRENCY sends are held in memory at a time, so
+        callers can persist results incrementally for very large campaigns.
+        
+        Args:
+            recipients: Iterable of dicts with 'phone_number' and optionally 'name'
+            message: Alert message content
+            report_data: Report data for context
+            
+        Returns:
+            Async iterator of AlertResult in completion order
+        """
+        return self._stream_bulk_alerts(recipients, message, self._sms_sender(report_data),
+                                        'sent', SMS_MESSAGES_PER_SECOND)
+    
+    def iter_make_bulk_voice_alerts(self, recipients: Iterable[Dict], message: str,
+                                    report_data: Dict) -> AsyncIterator[AlertResult]:
         """
-        Format phone number to E.164 format.
+        Stream voice call alert results as each call is placed.
         
         Args:
-            phone_number: Raw phone number string
+            recipients: Iterable of dicts with 'phone_number' and optionally 'name'
+            message: Alert message content for TTS
+            report_data: Report data for context
             
         Returns:
-            Formatted phone number or None if invalid
+            Async iterator of AlertResult in completion order
         """
+        return self._stream_bulk_alerts(recipients, message, self._voice_sender(report_data),
+                                        'called', VOICE_CALLS_PER_SECOND)
+    
+    def _sms_sender(self, report_data: Dict):
+        """Return a send coroutine function for SMS with the report-level parts built once."""
+        # Everything but the personalized greeting is identical across recipients
+        try:
+            header, footer = self._sms_message_parts(report_data)
+        except Exception as e:
+            logger.error(f"Could not build SMS alert from report data: {str(e)}")
+            return self._failing_sender(str(e))
+        
+        async def send(client: 'Client', phone_number: str, personalized_message: str) -> Tuple[bool, str]:
+            body = self._assemble_sms_message(header, personalized_message, footer)
+            return await self._send_sms_prepared_async(client, phone_number, body)
+        
+        return send
+    
+    def _voice_sender(self, report_data: Dict):
+        """Return a send coroutine function for voice calls with the report-level parts built once."""
+        # Everything but the personalized greeting is identical across recipients
+        try:
+            intro, closing = self._voice_message_parts(report_data)
+        except Exception as e:
+            logger.error(f"Could not build voice alert from report data: {str(e)}")
+            return self._failing_sender(str(e))
+        
+        async def send(client: 'Client', phone_number: str, personalized_message: str) -> Tuple[bool, str]:
+            voice_message = self._assemble_voice_message(intro, personalized_message, closing)
+            return await self._make_voice_call_prepared_async(client, phone_number, voice_message)
+        
+        return send
+    
+    def _failing_sender(self, error: str):
+        """Return a send coroutine function that records `error` for every recipient without sending."""
+        async def send(client: 'Client', phone_number: str, personalized_message: str) -> Tuple[bool, str]:
+            return False, error
+        
+        return send
+    
+    def _prepare_recipient(self, recipient: Dict) -> Tuple[str, Optional[str], Optional[str], Optional[str]]:
+        """
+        Validate a bulk recipient before any network I/O.
+        
+        Args:
+            recipient: Dict with 'phone_number' and optionally 'name'
+            
+        Returns:
+            Tuple of (name, phone_number, formatted_number, error); error is
+            None when the number is valid
+        """
+        phone_number = recipient.get('phone_number')
+        name = recipient.get('name', 'Subscriber')
+        
         if not phone_number:
-            return None
+            return name, phone_number, None, 'No phone number provided'
         
-        # Remove all non-digit characters
-        digits = ''.join(filter(str.isdigit, phone_number))
-        
-        # Handle Indian phone numbers (add +91 prefix if needed)
-        if len(digits) == 10 and digits.startswith(('9', '8', '7', '6')):
-            return f"+91{digits}"
-        elif len(digits) == 12 and digits.startswith('91'):
-            return f"+{digits}"
-        elif digits.startswith('+'):
-            return phone_number
-        elif len(digits) == 11 and digits.startswith('1'):  # US numbers
-            return f"+{digits}"
-        elif len(digits) >= 10:
-            return f"+{digits}"
+        formatted_number = _format_phone_number_cached(phone_number)
+        if not formatted_number:
+            return name, phone_number, None, 'Invalid phone number format'
         
-        return None
+        return name, phone_number, formatted_number, None
+    
+    async def _send_to_recipient(self, client: 'Client', bucket: _TokenBucket, name: str,
+                                 phone_number: str, formatted_number: str, message: str,
+                                 send_func, sent_status: str) -> AlertResult:
+        """
+        Personalize and send an alert to one validated recipient.
+        
+        Args:
+            client: Async Twilio client
+            bucket: Rate limiter shared by the bulk run
+            name: Recipient name
+            phone_number: Phone number as given
+            formatted_number: Phone number in E.164 format
+            message: Alert message content
+            send_func: Coroutine function (client, formatted_number, personalized_message)
+            sent_status: Status recorded for successful sends
+            
+        Returns:
+            AlertResult for the recipient
+        """
+        # Personalize message if name is available
+        personalized_message = f"Hello {name}, " + message if name != 'Subscriber' else message
+        
+        await bucket.acquire()
+        success, result = await send_func(client, formatted_number, personalized_message)
+        
+        if success:
+            return AlertResult(name, phone_number, sent_status, result, None)
+        return AlertResult(name, phone_number, 'failed', None, result)
+    
+    async def _stream_bulk_alerts(self, recipients: Iterable[Dict], message: str, send_func,
+                                  sent_status: str, rate: float) -> AsyncIterator[AlertResult]:
+        """
+        Send an alert to each recipient, yielding results as they complete.
+        
+        Recipients are pulled lazily, keeping at most BULK_MAX_CONCURRENCY
+        sends pending.
+        """
+        if not self.is_available():
+            for recipient in recipients:
+                yield AlertResult(recipient.get('name', 'Subscriber'), recipient.get('phone_number'),
+                                  'failed', None, 'Twilio service not available')
+            return
+        
+        bucket = _TokenBucket(rate)
+        client = self._create_async_client()
+        remaining = iter(recipients)
+        exhausted = False
+        pending = set()
+        
+        try:
+            while True:
+                while not exhausted and len(pending) < BULK_MAX_CONCURRENCY:
+                    recipient = next(remaining, None)
+                    if recipient is None:
+                        exhausted = True
+                        break
+                    
+                    # Invalid numbers fail immediately without taking a send slot
+                    name, phone_number, formatted_number, error = self._prepare_recipient(recipient)
+                    if error:
+                        yield AlertResult(name, phone_number, 'failed', None, error)
+                        continue
+                    
+                    pending.add(asyncio.ensure_future(self._send_to_recipient(
+                        client, bucket, name, phone_number, formatted_number, message, send_func, sent_status
+                    )))
+                if not pending:
+                    break
+                
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await client.http_client.close()
+    
+    async def _run_bulk_alerts(self, recipients: List[Dict], message: str,
+                               send_func, sent_status: str, id_key: str, rate: float) -> Dict:
+        """
+        Fan an alert out to all recipients with asyncio.gather.
+        
+        Sends are paced by a token bucket at `rate` per second when rate is
+        positive; the semaphore only caps how many requests are in flight. For campaigns too large to
+        hold in memory, use the iter_* streaming variants instead.
+        
+        Args:
+            recipients: List of dicts with 'phone_number' and optionally 'name'
+            message: Alert message content
+            send_func: Coroutine function (client, phone_number, personalized_message)
+            sent_status: Status recorded for successful sends
+            id_key: Detail key for the Twilio SID of successful sends
+            rate: Requests per second to pace sends at (0 disables pacing)
+            
+        Returns:
+            Dict with success/failure counts and per-recipient columns
+            ('recipients', 'phones', 'statuses', 'ids', 'errors'); use
+            details_iter() for row-wise access
+        """
+        count = len(recipients)
+        
+        if not self.is_available():
+            return {
+                'total': count,
+                'successful': 0,
+                'failed': count,
+                'id_key': id_key,
+                'recipients': [recipient.get('name', 'Subscriber') for recipient in recipients],
+                'phones': [recipient.get('phone_number') for recipient in recipients],
+                'statuses': ['failed'] * count,
+                'ids': [None] * count,
+                'errors': ['Twilio service not available'] * count
+            }
+        
+        # Validate every number before any network I/O; only valid recipients
+        # get a send task
+        prepared = [self._prepare_recipient(recipient) for recipient in recipients]
+        
+        # Columnar results, filled in place by recipient index
+        names = [row[0] for row in prepared]
+        phones = [row[1] for row in prepared]
+        statuses = ['failed'] * count
+        ids = [None] * count
+        errors = [row[3] for row in prepared]
+        
+        semaphore = asyncio.Semaphore(BULK_MAX_CONCURRENCY)
+        bucket = _TokenBucket(rate)
+        client = self._create_async_client()
+        
+        async def send_one(index: int) -> None:
+            name, phone_number, formatted_number, _ = prepared[index]
+            async with semaphore:
+                row = await self._send_to_recipient(client, bucket, name, phone_number, formatted_number,
+                                                    message, send_func, sent_status)
+            statuses[index], ids[index], errors[index] = row.status, row.sid, row.error
+        
+        try:
+            await asyncio.gather(*(send_one(i) for i, row in enumerate(prepared) if row[2]))
+        finally:
+            if client is not None:
+                await client.http_client.close()
+        
+        successful = statuses.count(sent_status)
+        return {
+            'total': count,
+            'successful': successful,
+            'failed': count - successful,
+            'id_key': id_key,
+            'recipients': names,
+            'phones': phones,
+            'statuses': statuses,
+            'ids': ids,
+            'errors': errors
+        }
+    
+    def _with_retry(self, operation):
+        """
+        Run a Twilio API call, retrying throttled and unavailable responses.
+        
+        Args:
+            operation: Zero-argument callable making the API request
+            
+        Returns:
+            The operation's result
+        """
+        for attempt in range(RETRY_MAX_ATTEMPTS + 1):
+            try:
+                return operation()
+            except _twilio().TwilioRestException as e:
+                if e.status not in RETRYABLE_STATUS_CODES or attempt == RETRY_MAX_ATTEMPTS:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                logger.warning(f"Twilio returned {e.status}, retrying in {delay:.1f}s ({attempt + 1}/{RETRY_MAX_ATTEMPTS})")
+                time.sleep(delay)
+    
+    async def _with_retry_async(self, client: 'Client', operation):
+        """
+        Await a Twilio API call, retrying throttled and unavailable responses.
+        
+        Attempts and backoff sleeps together are bounded by
+        BULK_TIMEOUT_BUDGET, so one stalled recipient cannot hold up a
+        bulk run.
+        
+        Args:
+            client: Async Twilio client the operation uses
+            operation: Zero-argument callable returning the request coroutine
+            
+        Returns:
+            The operation's result
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + BULK_TIMEOUT_BUDGET
+        
+        for attempt in range(RETRY_MAX_ATTEMPTS + 1):
+            try:
+                return await asyncio.wait_for(operation(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                raise _twilio().TwilioException(f"Request timed out after {BULK_TIMEOUT_BUDGET:g}s")
+            except _twilio().TwilioRestException as e:
+                if e.status not in RETRYABLE_STATUS_CODES or attempt == RETRY_MAX_ATTEMPTS:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                if loop.time() + delay >= deadline:
+                    raise
+                logger.warning(f"Twilio returned {e.status}, retrying in {delay:.1f}s ({attempt + 1}/{RETRY_MAX_ATTEMPTS})")
+                await asyncio.sleep(delay)
+    
+    def _retry_delay(self, attempt: int, error) -> float:
+        """
+        Seconds to wait before the next retry.
+        
+        Honors a Retry-After header carried by the error itself when present,
+        otherwise uses exponential backoff with jitter. Both are capped at
+        RETRY_MAX_DELAY. The shared http client's last_response is not used:
+        concurrent sends overwrite it, so it may belong to another request.
+        """
+        headers = getattr(error, 'headers', None) or getattr(getattr(error, 'response', None), 'headers', None)
+        retry_after = (headers or {}).get('Retry-After')
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        
+        return min(RETRY_BASE_DELAY * 2 ** attempt + random.random() * 0.5, RETRY_MAX_DELAY)
+    
+    def _create_async_client(self) -> Optional['Client']:
+        """
+        Create a Twilio client backed by an aiohttp session.
+        
+        The session is bound to the running event loop, so a new client is
+        created per bulk run and closed when it finishes.
+        """
+        if not self.is_available():
+            return None
+        if OFFLINE_MODE:
+            return self.client
+        twilio = _twilio()
+        return twilio.Client(self.account_sid, self.auth_token,
+                             http_client=twilio.AsyncTwilioHttpClient(timeout=TWILIO_HTTP_TIMEOUT))
+    
+    # Formatting does not depend on the instance; expose the memoized
+    # module-level function directly so calls skip a wrapper frame
+    _format_phone_number = staticmethod(_format_phone_number_cached)
     
     def _create_sms_message(self, base_message: str, report_data: Dict) -> str:
         """
@@ -291,30 +948,53 @@ class TwilioAlertService:
         Returns:
             Formatted SMS message
         """
+        header, footer = self._sms_message_parts(report_data)
+        return self._assemble_sms_message(header, base_message, footer)
+    
+    def _sms_message_parts(self, report_data: Dict) -> Tuple[str, str]:
+        """
+        Build the parts of the SMS that surround the base message.
+        
+        These depend only on the report, so bulk sends build them once.
+        
+        Args:
+            report_data: Report data for context
+            
+        Returns:
+            Tuple of (header, footer)
+        """
         location = ""
         if report_data.get('city') and report_data.get('state'):
-            location = f" in {report_data['city']}, {report_data['state']}"
+            location = f"{report_data['city']}, {report_data['state']}"
         elif report_data.get('address'):
-            location = f" at {report_data['address']}"
+            location = report_data['address']
         
         hazard_type = report_data.get('hazard_type', 'hazard')
         severity = report_data.get('severity', 'medium').upper()
         
-        sms_content = f"""
-🚨 COASTAL HAZARD ALERT 🚨
-
-{base_message}
-
-DETAILS:
-• Type: {hazard_type.title()}
-• Severity: {severity}
-• Location: {location}
-• Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-
-This is an automated alert from the Coastal Hazard Management System. Stay safe and follow local emergency guidelines.
-
-Reply STOP to unsubscribe.
-        """.strip()
+        details = (
+            ('Type', hazard_type.title()),
+            ('Severity', severity),
+            ('Location', location),
+            ('Time', _current_minute_timestamp()),
+        )
+        
+        header = "🚨 COASTAL HAZARD ALERT 🚨\n\n"
+        footer_lines = ['', '', 'DETAILS:']
+        footer_lines.extend(f"• {label}: {value}" for label, value in details if value)
+        footer_lines += [
+            '',
+            "This is an automated alert from the Coastal Hazard Management System. Stay safe and follow local emergency guidelines.",
+            '',
+            "Reply STOP to unsubscribe."
+        ]
+        footer = '\n'.join(footer_lines)
+        
+        return header, footer
+    
+    def _assemble_sms_message(self, header: str, base_message: str, footer: str) -> str:
+        """Join the SMS parts around a base message and enforce the length limit."""
+        sms_content = header + base_message + footer
         
         # Truncate if too long (SMS limit is 1600 characters)
         if len(sms_content) > 1500:
@@ -333,6 +1013,21 @@ Reply STOP to unsubscribe.
         Returns:
             Formatted voice message
         """
+        intro, closing = self._voice_message_parts(report_data)
+        return self._assemble_voice_message(intro, base_message, closing)
+    
+    def _voice_message_parts(self, report_data: Dict) -> Tuple[str, str]:
+        """
+        Build the parts of the voice message that surround the base message.
+        
+        These depend only on the report, so bulk calls build them once.
+        
+        Args:
+            report_data: Report data for context
+            
+        Returns:
+            Tuple of (intro, closing)
+        """
         location = ""
         if report_data.get('city') and report_data.get('state'):
             location = f" in {report_data['city']}, {report_data['state']}"
@@ -343,11 +1038,15 @@ Reply STOP to unsubscribe.
         severity = report_data.get('severity', 'medium').lower()
         
         # Create a clear, TTS-friendly message
-        voice_content = f"""This is an emergency alert from the Coastal Hazard Management System. {base_message} This is a {severity} severity {hazard_type} alert{location}. Please follow local emergency guidelines and stay safe."""
+        intro = "This is an emergency alert from the Coastal Hazard Management System. "
+        closing = f" This is a {severity} severity {hazard_type} alert{location}. Please follow local emergency guidelines and stay safe."
         
-        # Clean up the message for better TTS pronunciation
-        # Remove multiple spaces and newlines
-        voice_content = ' '.join(voice_content.split())
+        return intro, closing
+    
+    def _assemble_voice_message(self, intro: str, base_message: str, closing: str) -> str:
+        """Join the voice message parts around a base message and clean it up for TTS."""
+        # Remove multiple spaces and newlines for better TTS pronunciation
+        voice_content = ' '.join((intro + base_message + closing).split())
         
         # Ensure the message isn't too long (TTS works better with shorter messages)
         if len(voice_content) > 400:
@@ -355,6 +1054,22 @@ Reply STOP to unsubscribe.
         
         return voice_content
     
+    def _create_voice_twiml(self, voice_message: str) -> str:
+        """
+        Create TwiML that reads the voice message twice.
+        
+        Args:
+            voice_message: Formatted voice message
+            
+        Returns:
+            TwiML document string
+        """
+        # Escape XML special characters in the voice message
+        escaped_message = voice_message.translate(_XML_ESCAPE_TABLE)
+        
+        # Create proper TwiML with multiple Say elements for better delivery
+        return f'<Response><Say voice="alice" language="en">{escaped_message}</Say><Pause length="1"/><Say voice="alice" language="en">This message will now repeat.</Say><Pause length="1"/><Say voice="alice" language="en">{escaped_message}</Say></Response>'
+    
     def _create_twiml_url(self, message: str) -> str:
         """
         Create TwiML URL for voice calls (if using hosted TwiML).
@@ -363,39 +1078,14 @@ Reply STOP to unsubscribe.
         # For now, we'll use inline TwiML in the call creation
         return None
     
-    def get_alert_templates(self) -> Dict[str, Dict]:
+    def get_alert_templates(self) -> Mapping[str, Mapping[str, str]]:
         """
         Get predefined alert message templates.
         
         Returns:
             Dict of alert templates by severity/type
         """
-        return {
-            'flood_high': {
-                'sms': "URGENT: Severe flooding detected. Immediate evacuation may be required. Avoid flooded roads and seek higher ground.",
-                'voice': "Urgent flood alert. Severe flooding has been detected in your area. Immediate evacuation may be required. Please avoid flooded roads and seek higher ground immediately."
-            },
-            'flood_medium': {
-                'sms': "WARNING: Flooding reported in your area. Exercise caution, monitor conditions, and be prepared to evacuate if necessary.",
-                'voice': "Flood warning. Flooding has been reported in your area. Please exercise caution, monitor local conditions, and be prepared to evacuate if conditions worsen."
-            },
-            'tsunami_high': {
-                'sms': "TSUNAMI ALERT: Move to higher ground immediately. This is not a drill. Follow evacuation routes and official emergency instructions.",
-                'voice': "This is a tsunami alert. Move to higher ground immediately. This is not a drill. Please follow designated evacuation routes and listen to official emergency instructions."
-            },
-            'storm_surge_high': {
-                'sms': "STORM SURGE WARNING: Dangerous coastal flooding expected. Evacuate low-lying areas immediately. Do not attempt to travel through flood waters.",
-                'voice': "Storm surge warning. Dangerous coastal flooding is expected in your area. Please evacuate low-lying areas immediately. Do not attempt to travel through flood waters."
-            },
-            'general_high': {
-                'sms': "EMERGENCY ALERT: Serious coastal hazard detected in your area. Follow local emergency instructions and stay informed through official channels.",
-                'voice': "Emergency alert. A serious coastal hazard has been detected in your area. Please follow local emergency instructions and stay informed through official channels."
-            },
-            'general_medium': {
-                'sms': "HAZARD ALERT: Coastal hazard conditions detected. Monitor local conditions and be prepared to take action if advised by authorities.",
-                'voice': "Hazard alert. Coastal hazard conditions have been detected in your area. Please monitor local conditions and be prepared to take action if advised by authorities."
-            }
-        }
+        return _ALERT_TEMPLATES
     
     def get_template_message(self, hazard_type: str, severity: str, message_type: str = 'sms') -> str:
         """
@@ -409,20 +1099,20 @@ Reply STOP to unsubscribe.
         Returns:
             Template message string
         """
-        templates = self.get_alert_templates()
-        
-        # Try specific hazard type + severity combination
-        template_key = f"{hazard_type.lower()}_{severity.lower()}"
-        if template_key in templates:
-            return templates[template_key].get(message_type, templates[template_key].get('sms', ''))
+        hazard = hazard_type.lower()
+        severity = severity.lower()
         
-        # Fall back to general template
-        general_key = f"general_{severity.lower()}"
-        if general_key in templates:
-            return templates[general_key].get(message_type, templates[general_key].get('sms', ''))
+        # Specific hazard + severity, then the general template for the severity;
+        # channels without a template fall back to the SMS text
+        template = (_FLAT_TEMPLATES.get((hazard, severity, message_type))
+                    or _FLAT_TEMPLATES.get((hazard, severity, 'sms'))
+                    or _FLAT_TEMPLATES.get(('general', severity, message_type))
+                    or _FLAT_TEMPLATES.get(('general', severity, 'sms')))
+        if template:
+            return template
         
         # Default message
-        return f"Alert: {hazard_type.title()} hazard detected with {severity.lower()} severity. Please stay informed and follow official guidance."
+        return f"Alert: {hazard_type.title()} hazard detected with {severity} severity. Please stay informed and follow official guidance."
 
 
 # Global instance
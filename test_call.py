@@ -10,15 +10,12 @@ from pathlib import Path
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
-from services.twilio_alert_service import TwilioAlertService
+from services.twilio_alert_service import twilio_service as service
 
 def main():
     print("🚨 EMERGENCY CALL TEST")
     print("=" * 50)
     
-    # Initialize service
-    service = TwilioAlertService()
-    
     if not service.is_available():
         print("❌ Twilio service not available")
         return False
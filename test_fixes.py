@@ -17,10 +17,8 @@ def test_twilio_voice_call():
     print("🔊 Testing Twilio Voice Call Functionality...")
     
     try:
-        from services.twilio_alert_service import TwilioAlertService
-        
-        # Create instance
-        twilio_service = TwilioAlertService()
+        # Shared instance (reuses the pooled Twilio session)
+        from services.twilio_alert_service import twilio_service
         
         # Test voice message creation
         report_data = {
@@ -39,7 +37,11 @@ def test_twilio_voice_call():
         
         # Test TTS-friendly format
         assert len(voice_message) > 0, "Voice message should not be empty"
-        assert '&amp;' not in voice_message or '&lt;' not in voice_message, "Voice message should not contain XML entities before escaping"
+        assert '&amp;' not in voice_message and '&lt;' not in voice_message, "Voice message should not contain XML entities before escaping"
+        
+        # Test XML escaping of the TwiML body
+        twiml = twilio_service._create_voice_twiml("Tides & <surge> \"now\"")
+        assert 'Tides &amp; &lt;surge&gt; &quot;now&quot;' in twiml, "TwiML should XML-escape the voice message"
         
         print("✅ Voice call service is properly configured")
         
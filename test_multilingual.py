@@ -3,56 +3,72 @@
 Test script to verify comprehensive multilingual support across all pages
 """
 
+import re
 import sys
-import json
+from functools import reduce
+from operator import getitem
 from pathlib import Path
 
-def test_translations_coverage():
+import orjson
+
+# t() calls and "| t" filter uses in templates, matched in one pass
+TRANSLATION_CALL_RE = re.compile(rb"(\{\{ t\(')|(\| t)")
+
+# Languages under test (English and Hindi)
+LANGUAGES = ('en', 'hi')
+
+# Sections that should be available, pre-split into (key, path) pairs
+_REQUIRED = tuple((key, tuple(key.split('.'))) for key in (
+    'brand',
+    'nav.admin_dashboard',
+    'nav.login',
+    'nav.logout',
+    'common.welcome',
+    'common.send',
+    'common.cancel',
+    'dashboard.title',
+    'dashboard.stats.total_reports',
+    'alerts.confirm_title',
+    'alerts.send_alert',
+    'auth.login.title',
+    'auth.login.email',
+    'auth.login.password',
+    'auth.signup.title',
+    'auth.signup.name',
+    'admin.dashboard.title',
+    'admin.reports.title',
+    'reports.create.title',
+    'reports.create.hazard_type',
+    'reports.create.city',
+    'forms.required_field',
+    'status.pending',
+    'severity.high',
+    'hazard_types.flood'
+))
+
+def load_translations_file(languages=None):
+    """Parse config/translations.json in one pass, keeping only `languages` when given"""
+    translations_file = Path(__file__).parent / 'config' / 'translations.json'
+    
+    translations = orjson.loads(translations_file.read_bytes())
+    
+    if languages:
+        return {lang: translations[lang] for lang in languages if lang in translations}
+    return translations
+
+def test_translations_coverage(translations=None):
     """Test that translations cover all major UI sections"""
     print("🌍 Testing Multilingual Coverage...")
     
     try:
-        translations_file = Path(__file__).parent / 'config' / 'translations.json'
-        with open(translations_file, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
-        
-        # Test languages
-        languages = ['en', 'hi']  # Test English and Hindi
-        
-        # Test sections that should be available
-        required_sections = [
-            'brand',
-            'nav.admin_dashboard',
-            'nav.login',
-            'nav.logout',
-            'common.welcome',
-            'common.send',
-            'common.cancel',
-            'dashboard.title',
-            'dashboard.stats.total_reports',
-            'alerts.confirm_title',
-            'alerts.send_alert',
-            'auth.login.title',
-            'auth.login.email',
-            'auth.login.password',
-            'auth.signup.title',
-            'auth.signup.name',
-            'admin.dashboard.title',
-            'admin.reports.title',
-            'reports.create.title',
-            'reports.create.hazard_type',
-            'reports.create.city',
-            'forms.required_field',
-            'status.pending',
-            'severity.high',
-            'hazard_types.flood'
-        ]
+        if translations is None:
+            translations = load_translations_file(LANGUAGES)
         
-        print(f"Testing {len(required_sections)} key translation points...")
+        print(f"Testing {len(_REQUIRED)} key translation points...")
         
         all_passed = True
         
-        for lang in languages:
+        for lang in LANGUAGES:
             print(f"\n🗣️  Testing {lang} language:")
             
             if lang not in translations:
@@ -62,23 +78,25 @@ def test_translations_coverage():
             
             lang_data = translations[lang]
             missing_keys = []
+            lines = []  # Per-key results, written in one go after the loop
             
-            for key in required_sections:
-                keys = key.split('.')
-                current = lang_data
-                
+            for key, parts in _REQUIRED:
                 try:
-                    for k in keys:
-                        current = current[k]
-                    
-                    # Verify the translation is not empty
-                    if not current or current.strip() == "":
-                        missing_keys.append(f"{key} (empty)")
-                    else:
-                        print(f"  ✅ {key}: '{current[:30]}{'...' if len(current) > 30 else ''}'")
-                        
+                    current = reduce(getitem, parts, lang_data)
                 except (KeyError, TypeError):
                     missing_keys.append(key)
+                    continue
+                
+                if not isinstance(current, str):
+                    missing_keys.append(key)
+                elif current.strip() == "":
+                    # Verify the translation is not empty
+                    missing_keys.append(f"{key} (empty)")
+                else:
+                    lines.append(f"  ✅ {key}: '{current[:30]}{'...' if len(current) > 30 else ''}'")
+            
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
             
             if missing_keys:
                 print(f"  ❌ Missing keys for {lang}: {', '.join(missing_keys)}")
@@ -104,21 +122,28 @@ def test_template_files():
         'templates/user_new/create_report.html'
     ]
     
+    # Index the templates directory once instead of stat-ing each path
+    base_dir = Path(__file__).parent
+    existing = {p.relative_to(base_dir).as_posix() for p in (base_dir / 'templates').rglob('*.html')}
+    
     all_passed = True
     
     for template_path in template_files:
         try:
-            file_path = Path(__file__).parent / template_path
-            if not file_path.exists():
+            if template_path not in existing:
                 print(f"⚠️  Template not found: {template_path}")
                 continue
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            
+            # Raw bytes are enough for counting ASCII markers; skip the text decode
+            content = (base_dir / template_path).read_bytes()
             
             # Check for translation function usage
-            t_function_count = content.count("{{ t('")
-            filter_count = content.count("| t")
+            t_function_count = filter_count = 0
+            for match in TRANSLATION_CALL_RE.finditer(content):
+                if match.lastindex == 1:
+                    t_function_count += 1
+                else:
+                    filter_count += 1
             
             if t_function_count > 0 or filter_count > 0:
                 print(f"✅ {template_path}: {t_function_count} t() calls, {filter_count} filter calls")
@@ -139,10 +164,8 @@ def test_flask_integration():
     try:
         # Import Flask app components
         sys.path.append(str(Path(__file__).parent))
-        from app import get_translation, load_translations
-        
-        # Load translations first
-        load_translations()
+        # Importing app loads translations once; no separate reload needed
+        from app import get_translation
         
         # Test key translations
         test_cases = [
@@ -183,7 +206,12 @@ def main():
     results = []
     
     # Test 1: Translations coverage
-    results.append(test_translations_coverage())
+    try:
+        translations = load_translations_file(LANGUAGES)
+    except Exception as e:
+        print(f"❌ Error loading translations: {e}")
+        translations = {}
+    results.append(test_translations_coverage(translations))
     
     # Test 2: Template files
     results.append(test_template_files())
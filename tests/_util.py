@@ -0,0 +1,8 @@
+"""
+Small helpers shared by the test scripts in this directory.
+"""
+
+
+def short(text: str, limit: int = 80) -> str:
+    """Truncate text for console output, adding '...' only when something was cut."""
+    return text if len(text) <= limit else text[:limit] + '...'
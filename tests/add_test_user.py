@@ -6,15 +6,37 @@ Add a test user with phone number for alert testing
 import sqlite3
 from werkzeug.security import generate_password_hash
 
+# SQL kept as constants so sqlite3's per-connection statement cache is reused
+SQL_CHECK_USER = 'SELECT * FROM users WHERE email = ?'
+
+SQL_INSERT_USER = '''
+    INSERT INTO users (email, name, password_hash, phone_number, alert_preferences, role)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+SQL_INSERT_REPORT = '''
+    INSERT INTO reports (
+        user_id, title, description, hazard_type, severity,
+        latitude, longitude, city, state, status, correlation_confidence
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_INSERT_HISTORY = '''
+    INSERT INTO report_status_history (
+        report_id, old_status, new_status, changed_by,
+        admin_notes, correlation_confidence, social_media_count, change_reason
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 def add_test_user():
     """Add test user with phone number."""
     
-    # Connect to database
-    conn = sqlite3.connect('coastal_hazards.db')
+    # Connect to database (autocommit mode; the transaction is managed explicitly)
+    conn = sqlite3.connect('coastal_hazards.db', isolation_level=None)
     cursor = conn.cursor()
     
     # Check if test user already exists
-    cursor.execute('SELECT * FROM users WHERE email = ?', ('testuser@example.com',))
+    cursor.execute(SQL_CHECK_USER, ('testuser@example.com',))
     if cursor.fetchone():
         print("✅ Test user already exists")
         conn.close()
@@ -22,10 +44,8 @@ def add_test_user():
     
     # Create test user with phone number
     password_hash = generate_password_hash('testpass123')
-    cursor.execute('''
-        INSERT INTO users (email, name, password_hash, phone_number, alert_preferences, role)
-        VALUES (?, ?, ?, ?, ?, ?)
-    ''', (
+    cursor.execute('BEGIN')
+    cursor.execute(SQL_INSERT_USER, (
         'testuser@example.com', 
         'Test User', 
         password_hash, 
@@ -37,12 +57,7 @@ def add_test_user():
     user_id = cursor.lastrowid
     
     # Also create a test report for the user
-    cursor.execute('''
-        INSERT INTO reports (
-            user_id, title, description, hazard_type, severity,
-            latitude, longitude, city, state, status, correlation_confidence
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
+    cursor.execute(SQL_INSERT_REPORT, (
         user_id,
         'TEST: Coastal Flooding in Mumbai',
         'Severe flooding observed near Marine Drive. Water levels rising rapidly due to high tide and heavy rains.',
@@ -57,18 +72,13 @@ def add_test_user():
     report_id = cursor.lastrowid
     
     # Add to status history
-    cursor.execute('''
-        INSERT INTO report_status_history (
-            report_id, old_status, new_status, changed_by,
-            admin_notes, correlation_confidence, social_media_count, change_reason
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
+    cursor.execute(SQL_INSERT_HISTORY, (
         report_id, None, 'pending', user_id,
         'Test report created for alert system testing', 0.85, 0,
         'Test data creation'
     ))
     
-    conn.commit()
+    cursor.execute('COMMIT')
     conn.close()
     
     print("✅ Test user created successfully!")
@@ -5,25 +5,102 @@ Main Flask app with Admin (Government) and User (Citizen) portals.
 
 import os
 import sys
-import json
 import asyncio
 import uuid
-from datetime import datetime, timedelta
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
+import math
+import itertools
+import time
+from datetime import datetime, timedelta, timezone
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session, make_response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache
+import atexit
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from loguru import logger
-from functools import wraps
+import orjson
+from functools import wraps, lru_cache
+from typing import NamedTuple
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# NumPy is optional; it vectorizes batch distance calculations
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Numba is optional; it JIT-compiles the point-to-many haversine kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# uuid_utils is optional; it provides time-ordered UUIDv7 report IDs
+try:
+    from uuid_utils import uuid7
+    UUID_UTILS_AVAILABLE = True
+except ImportError:
+    UUID_UTILS_AVAILABLE = False
+
+# scikit-learn is optional; its BallTree answers hotspot radius queries in O(log N)
+try:
+    from sklearn.neighbors import BallTree
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Redis and H3 are optional; together they cache hotspots per hexagonal map cell
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import h3
+    H3_AVAILABLE = True
+    # h3 v4 renamed the v3 functions
+    _h3_cell = getattr(h3, 'latlng_to_cell', None) or h3.geo_to_h3
+    _h3_disk = getattr(h3, 'grid_disk', None) or h3.k_ring
+except ImportError:
+    H3_AVAILABLE = False
+
+# Flask-Compress is optional; it brotli/gzip-compresses HTML and JSON responses
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+# Flask-Limiter is optional; it throttles expensive POST endpoints per client IP
+try:
+    from flask_limiter import Limiter
+    from flask_limiter.util import get_remote_address
+    LIMITER_AVAILABLE = True
+except ImportError:
+    LIMITER_AVAILABLE = False
+
+# Flask-Caching is optional; it collapses repeated dashboard API reads
+try:
+    from flask_caching import Cache
+    CACHING_AVAILABLE = True
+except ImportError:
+    CACHING_AVAILABLE = False
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
-print(f"🔑 Environment Variables Loaded:")
-print(f"   RAPIDAPI_KEY: {'✅ Set' if os.getenv('RAPIDAPI_KEY') else '❌ Not set'}")
-print(f"   OPENROUTER_API_KEY: {'✅ Set' if os.getenv('OPENROUTER_API_KEY') else '❌ Not set'}")
-print(f"   TWITTER_BEARER_TOKEN: {'✅ Set' if os.getenv('TWITTER_BEARER_TOKEN') else '❌ Not set'}")
+def _report_env():
+    """Print which API keys are configured (run from __main__ only, not on import)."""
+    print(f"🔑 Environment Variables Loaded:")
+    print(f"   RAPIDAPI_KEY: {'✅ Set' if os.getenv('RAPIDAPI_KEY') else '❌ Not set'}")
+    print(f"   OPENROUTER_API_KEY: {'✅ Set' if os.getenv('OPENROUTER_API_KEY') else '❌ Not set'}")
+    print(f"   TWITTER_BEARER_TOKEN: {'✅ Set' if os.getenv('TWITTER_BEARER_TOKEN') else '❌ Not set'}")
 
 # Add src directory to path for imports
 sys.path.append(str(Path(__file__).parent / 'src'))
@@ -48,6 +125,75 @@ app = Flask(__name__)
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'coastal-disaster-management-secret-key')
 CORS(app)  # Enable CORS for API access
 
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Serve jsonify responses and request bodies through orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        default = kwargs.pop('default', self.default)
+        sort_keys = kwargs.pop('sort_keys', self.sort_keys)
+        if kwargs:
+            # indent, ensure_ascii and other stdlib-only options keep Flask's encoder
+            return super().dumps(obj, default=default, sort_keys=sort_keys, **kwargs)
+        
+        # Datetimes fall through to `default` so their format is unchanged
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = OrjsonJSONProvider(app)
+
+# Compress responses large enough to benefit (the dashboards carry inline CSS)
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
+# Templates live next to this module; compiled Jinja bytecode is persisted so
+# warm restarts skip parsing and compiling (both set up by setup_app())
+TEMPLATES_DIR = Path(app.root_path) / app.template_folder
+JINJA_CACHE_DIR = Path(os.getenv('JINJA_CACHE_DIR', '.jinja_cache'))
+
+# Per-IP throttling; share counters across workers by pointing
+# RATELIMIT_STORAGE_URI at Redis (e.g. redis://localhost:6379)
+if LIMITER_AVAILABLE:
+    limiter = Limiter(
+        get_remote_address,
+        app=app,
+        storage_uri=os.getenv('RATELIMIT_STORAGE_URI', 'memory://'),
+        headers_enabled=True
+    )
+    rate_limit = limiter.limit
+else:
+    limiter = None
+    
+    def rate_limit(limit_value, **kwargs):
+        """No-op stand-in for Limiter.limit when Flask-Limiter is missing."""
+        return lambda f: f
+
+# Short-lived response cache for polled API endpoints; use RedisCache via
+# CACHE_TYPE when running several worker processes
+STATUS_CACHE_TIMEOUT = 2
+DATA_CACHE_TIMEOUT = 30
+if CACHING_AVAILABLE:
+    cache = Cache(app, config={'CACHE_TYPE': os.getenv('CACHE_TYPE', 'SimpleCache')})
+    cached_view = cache.cached
+else:
+    cache = None
+    
+    def cached_view(timeout=None, **kwargs):
+        """No-op stand-in for Cache.cached when Flask-Caching is missing."""
+        return lambda f: f
+
+def invalidate_status_cache():
+    """Drop cached system status and hotspot responses after state changes."""
+    if cache is not None:
+        cache.delete('view//api/system-status')
+        cache.delete('view//api/hotspots')
+
 # Global services (with error handling)
 try:
     data_ingestion = DataIngestionService()
@@ -71,26 +217,92 @@ system_status = {
     'system_health': 'healthy'
 }
 
-# Demo user credentials (in production, use proper database and hashing)
+class User(NamedTuple):
+    """Demo user record."""
+    password_hash: str
+    role: str
+    name: str
+
+class DashboardStats(NamedTuple):
+    """Headline counts shown on the admin dashboard."""
+    total_reports: int = 0
+    total_hotspots: int = 0
+    total_social_posts: int = 0
+    recent_reports_count: int = 0
+    high_confidence_reports_count: int = 0
+
+def iso_now(offset_seconds=0):
+    """Current UTC time plus offset_seconds as an ISO 8601 string with second precision."""
+    return datetime.fromtimestamp(time.time() + offset_seconds, tz=timezone.utc).isoformat(timespec='seconds')
+
+def new_report_id():
+    """Return an opaque 32-character hex report ID, time-ordered when uuid_utils is installed."""
+    if UUID_UTILS_AVAILABLE:
+        return uuid7().hex
+    return uuid.uuid4().hex
+
+# Bounded background workers: report analysis runs in parallel up to
+# REPORT_WORKERS, Agent 1 runs one at a time on its own event loop so its
+# blocking preprocessing never stalls the shared report loop
+REPORT_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv('REPORT_WORKERS', 8)), thread_name_prefix='report')
+AGENT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='agent1')
+atexit.register(REPORT_EXECUTOR.shutdown, wait=False)
+atexit.register(AGENT_EXECUTOR.shutdown, wait=False)
+
+# One long-lived event loop shared by report analysis, so HTTP client
+# sessions and keep-alive connections survive between reports
+REPORT_TIMEOUT = 120
+AGENT1_TIMEOUT = 600
+AGENT1_INTERVAL_SECONDS = 12 * 60 * 60
+
+@lru_cache(maxsize=1)
+def _background_loop():
+    """Start the shared loop thread on first use (after any gunicorn fork)."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name='background-loop', daemon=True).start()
+    return loop
+
+def run_on_background_loop(coro, timeout):
+    """Run a coroutine on the shared background loop and wait for its result.
+    
+    Args:
+        coro: Coroutine to schedule
+        timeout: Seconds to wait before cancelling it
+        
+    Returns:
+        The coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _background_loop())
+    try:
+        return future.result(timeout=timeout)
+    except Exception:
+        future.cancel()
+        raise
+
+# Demo user credentials, hashed at startup (in production, use a proper database)
 USERS = {
-    'admin': {
-        'password': 'admin123',
-        'role': 'admin',
-        'name': 'System Administrator'
-    },
-    'citizen': {
-        'password': 'citizen123',
-        'role': 'citizen',
-        'name': 'Citizen User'
-    }
+    'admin': User(generate_password_hash('admin123'), 'admin', 'System Administrator'),
+    'citizen': User(generate_password_hash('citizen123'), 'citizen', 'Citizen User')
 }
 
+@lru_cache(maxsize=256)
+def get_user(username):
+    """Look up a user record by username (cached; stands in for a DB query)."""
+    return USERS.get(username)
+
 # ==============================================================================
 # AUTHENTICATION SYSTEM
 # ==============================================================================
 
+# One decorator per role, shared by every view that requires it
+_LOGIN_REQUIRED_CACHE = {}
+
 def login_required(role=None):
     """Decorator to require login for routes."""
+    cached = _LOGIN_REQUIRED_CACHE.get(role)
+    if cached is not None:
+        return cached
+    
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
@@ -103,6 +315,8 @@ def login_required(role=None):
             
             return f(*args, **kwargs)
         return decorated_function
+    
+    _LOGIN_REQUIRED_CACHE[role] = decorator
     return decorator
 
 @app.route('/login', methods=['GET', 'POST'])
@@ -114,22 +328,22 @@ def login():
         user_type = request.form['user_type']
         
         # Check credentials
-        if username in USERS and USERS[username]['password'] == password:
-            user = USERS[username]
+        user = get_user(username)
+        if user and check_password_hash(user.password_hash, password):
             
             # Verify user type matches role
-            if (user_type == 'admin' and user['role'] == 'admin') or \
-               (user_type == 'citizen' and user['role'] == 'citizen'):
+            if (user_type == 'admin' and user.role == 'admin') or \
+               (user_type == 'citizen' and user.role == 'citizen'):
                 
                 # Set session
                 session['user_id'] = username
-                session['role'] = user['role']
-                session['name'] = user['name']
+                session['role'] = user.role
+                session['name'] = user.name
                 
-                flash(f'Welcome, {user["name"]}!', 'success')
+                flash(f'Welcome, {user.name}!', 'success')
                 
                 # Redirect based on role
-                if user['role'] == 'admin':
+                if user.role == 'admin':
                     return redirect(url_for('admin_dashboard'))
                 else:
                     return redirect(url_for('user_dashboard'))
@@ -148,6 +362,25 @@ def logout():
     flash(f'Goodbye, {name}! You have been logged out.', 'info')
     return redirect(url_for('login'))
 
+def render_conditional(template_name, **context):
+    """Render a template as a conditional response with an ETag.
+    
+    Pages are per-user and change with system status, so the browser must
+    revalidate on every view (no-cache); an unchanged page costs a 304.
+    
+    Args:
+        template_name: Template to render
+        **context: Template context
+        
+    Returns:
+        Response, or an empty 304 when the client's copy is current
+    """
+    response = make_response(render_template(template_name, **context))
+    response.add_etag()
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 # ==============================================================================
 # ADMIN PORTAL ROUTES (Government Dashboard)
 # ==============================================================================
@@ -158,22 +391,16 @@ def admin_dashboard():
     """Admin dashboard - Government portal for monitoring and management."""
     
     # Placeholder data for UI testing
-    stats = {
-        'total_reports': 0,
-        'total_hotspots': 0,
-        'total_social_posts': 0,
-        'recent_reports_count': 0,
-        'high_confidence_reports_count': 0
-    }
+    stats = DashboardStats()
     
     recent_reports = []
     active_hotspots = []
     
-    return render_template('admin/dashboard.html', 
-                         stats=stats,
-                         recent_reports=recent_reports,
-                         active_hotspots=active_hotspots,
-                         system_status=system_status)
+    return render_conditional('admin/dashboard.html',
+                              stats=stats,
+                              recent_reports=recent_reports,
+                              active_hotspots=active_hotspots,
+                              system_status=system_status)
 
 @app.route('/admin/reports')
 @login_required('admin')
@@ -246,10 +473,11 @@ def user_dashboard():
     # Placeholder data
     active_hotspots = []
     
-    return render_template('user/dashboard.html', 
-                         active_hotspots=active_hotspots)
+    return render_conditional('user/dashboard.html',
+                              active_hotspots=active_hotspots)
 
 @app.route('/user/report', methods=['GET', 'POST'])
+@rate_limit("5/minute;50/hour", methods=['POST'])
 @login_required('citizen')
 def user_create_report():
     """Create new disaster report."""
@@ -258,7 +486,7 @@ def user_create_report():
         try:
             # Get location from form
             report_data = {
-                'id': str(uuid.uuid4()),
+                'id': new_report_id(),
                 'title': request.form['title'],
                 'description': request.form['description'],
                 'hazard_type': request.form['hazard_type'],
@@ -269,17 +497,12 @@ def user_create_report():
                 'city': request.form.get('city', ''),
                 'state': request.form.get('state', ''),
                 'reporter_ip': request.remote_addr,
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': iso_now()
             }
             
             # Process report with Agent 2 in background
             if services_available:
-                thread = threading.Thread(
-                    target=process_report_background, 
-                    args=(report_data,)
-                )
-                thread.daemon = True
-                thread.start()
+                REPORT_EXECUTOR.submit(process_report_background, report_data)
             
             flash('Report submitted successfully! Our system is analyzing it for correlations with social media data.', 'success')
             return redirect(url_for('user_my_reports'))
@@ -310,10 +533,10 @@ def user_map():
     user_lat = request.args.get('lat', type=float)
     user_lon = request.args.get('lon', type=float)
     
-    # Placeholder data
+    has_location = user_lat is not None and user_lon is not None
     map_data = {
-        'hotspots': [],
-        'user_location': {'lat': user_lat, 'lon': user_lon} if user_lat and user_lon else None
+        'hotspots': hotspots_within(user_lat, user_lon) if has_location else [],
+        'user_location': {'lat': user_lat, 'lon': user_lon} if has_location else None
     }
     
     return render_template('user/map.html', map_data=map_data)
@@ -336,16 +559,11 @@ def user_verify_report(report_id):
 def process_report_background(report_data):
     """Process user report with Agent 2 in background thread."""
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         # Process with Agent 2
-        enhanced_report = loop.run_until_complete(process_user_report(report_data))
+        enhanced_report = run_on_background_loop(process_user_report(report_data), REPORT_TIMEOUT)
         
         logger.info(f"Successfully processed user report {enhanced_report['id']} with confidence {enhanced_report.get('correlation_confidence', 0.0)}")
         
-        loop.close()
-        
     except Exception as e:
         logger.error(f"Error processing user report in background: {str(e)}")
 
@@ -354,11 +572,13 @@ def process_report_background(report_data):
 # ==============================================================================
 
 @app.route('/api/system-status')
+@cached_view(timeout=STATUS_CACHE_TIMEOUT)
 def api_system_status():
     """Get current system status."""
     return jsonify(system_status)
 
 @app.route('/api/hotspots')
+@cached_view(timeout=DATA_CACHE_TIMEOUT)
 def api_hotspots():
     """API endpoint for hotspot data."""
     return jsonify({
@@ -366,6 +586,7 @@ def api_hotspots():
     })
 
 @app.route('/api/reports')
+@cached_view(timeout=DATA_CACHE_TIMEOUT)
 def api_reports():
     """API endpoint for report data."""
     return jsonify({
@@ -373,6 +594,7 @@ def api_reports():
     })
 
 @app.route('/api/run-agent1', methods=['POST'])
+@rate_limit("1/minute")
 def api_run_agent1():
     """Manually trigger Agent 1 (social media monitoring)."""
     
@@ -383,64 +605,97 @@ def api_run_agent1():
         return jsonify({'error': 'Services not available'}), 500
     
     # Start Agent 1 in background
-    thread = threading.Thread(target=run_agent1_background)
-    thread.daemon = True
-    thread.start()
+    AGENT_EXECUTOR.submit(run_agent1_background)
     
     return jsonify({'message': 'Agent 1 started successfully'})
 
+# Posts per analyze_posts call and how many of those calls run at once
+ANALYSIS_CHUNK_SIZE = 32
+ANALYSIS_CONCURRENCY = 8
+
+async def analyze_in_chunks(posts, size=ANALYSIS_CHUNK_SIZE, concurrency=ANALYSIS_CONCURRENCY):
+    """Run AI analysis over chunks of posts concurrently.
+    
+    Args:
+        posts: Processed posts to analyze
+        size: Number of posts per chunk
+        concurrency: Maximum chunks analyzed at the same time
+        
+    Returns:
+        Analyzed posts in their original order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run(chunk):
+        async with semaphore:
+            return await ai_analysis.analyze_posts(chunk)
+    
+    chunks = [posts[i:i + size] for i in range(0, len(posts), size)]
+    results = await asyncio.gather(*(run(chunk) for chunk in chunks))
+    return list(itertools.chain.from_iterable(results))
+
+async def _run_agent1_pipeline():
+    """Fetch, process, analyze and aggregate the last 12 hours of posts."""
+    # Fetch social media posts
+    start_time = datetime.utcnow() - timedelta(hours=12)
+    end_time = datetime.utcnow()
+    
+    raw_posts = await data_ingestion.fetch_social_media_posts(start_time, end_time)
+    
+    # Process posts
+    processed_posts = await preprocessing.process_posts(raw_posts)
+    analyzed_posts = await analyze_in_chunks(processed_posts)
+    hotspots = await aggregation.detect_hotspots(analyzed_posts)
+    
+    return analyzed_posts, hotspots
+
 def run_agent1_background():
     """Run Agent 1 in background thread."""
     system_status['agent1_running'] = True
-    system_status['agent1_last_run'] = datetime.utcnow().isoformat()
+    system_status['agent1_last_run'] = iso_now()
+    invalidate_status_cache()
     
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        # Fetch social media posts
-        start_time = datetime.utcnow() - timedelta(hours=12)
-        end_time = datetime.utcnow()
-        
-        raw_posts = loop.run_until_complete(
-            data_ingestion.fetch_social_media_posts(start_time, end_time)
-        )
-        
-        # Process posts
-        processed_posts = loop.run_until_complete(
-            preprocessing.process_posts(raw_posts)
-        )
-        
-        analyzed_posts = loop.run_until_complete(
-            ai_analysis.analyze_posts(processed_posts)
-        )
-        
-        hotspots = loop.run_until_complete(
-            aggregation.detect_hotspots(analyzed_posts)
-        )
+        analyzed_posts, hotspots = asyncio.run(asyncio.wait_for(_run_agent1_pipeline(), AGENT1_TIMEOUT))
         
         system_status['total_social_posts'] = len(analyzed_posts)
         system_status['total_hotspots'] = len(hotspots)
+        index_hotspots(hotspots)
+        cache_hotspots_by_cell(hotspots)
         
         logger.info(f"Agent 1 completed: {len(analyzed_posts)} posts, {len(hotspots)} hotspots")
         
-        loop.close()
-        
     except Exception as e:
         logger.error(f"Error in Agent 1 background processing: {str(e)}")
         system_status['system_health'] = 'error'
     finally:
         system_status['agent1_running'] = False
-        system_status['agent1_next_run'] = (datetime.utcnow() + timedelta(hours=12)).isoformat()
+        system_status['agent1_next_run'] = iso_now(AGENT1_INTERVAL_SECONDS)
+        invalidate_status_cache()
 
 # ==============================================================================
 # UTILITY FUNCTIONS
 # ==============================================================================
 
+EARTH_RADIUS_KM = 6371
+
 def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance between two coordinates in kilometers."""
-    import math
-    R = 6371  # Earth's radius in km
+    """
+    Calculate distance between two coordinates in kilometers.
+    
+    Scalars take a plain math fast path; NumPy arrays are computed
+    element-wise with broadcasting. One point against 1-D arrays of points
+    uses the Numba kernel when available.
+    """
+    if NUMPY_AVAILABLE and any(isinstance(v, np.ndarray) for v in (lat1, lon1, lat2, lon2)):
+        if (NUMBA_AVAILABLE and np.isscalar(lat1) and np.isscalar(lon1)
+                and isinstance(lat2, np.ndarray) and lat2.ndim == 1):
+            lats = np.ascontiguousarray(lat2, dtype=np.float64)
+            lons = np.ascontiguousarray(lon2, dtype=np.float64)
+            out = np.empty(lats.shape[0])
+            _haversine_bulk(float(lat1), float(lon1), lats, lons, out)
+            return out
+        return _haversine_np(lat1, lon1, lat2, lon2)
     
     dlat = math.radians(lat2 - lat1)
     dlon = math.radians(lon2 - lon1)
@@ -449,17 +704,260 @@ def calculate_distance(lat1, lon1, lat2, lon2):
          math.sin(dlon / 2) ** 2)
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     
-    return R * c
+    return EARTH_RADIUS_KM * c
+
+def _haversine_np(lat1, lon1, lat2, lon2, out=None):
+    """
+    Vectorized haversine distance in kilometers (inputs in degrees, broadcastable).
+    
+    Works in place on two result-sized buffers instead of allocating a new
+    array for every intermediate step. Pass a float64 array of the broadcast
+    shape as out to reuse it across calls.
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(v) for v in (lat1, lon1, lat2, lon2))
+    if out is None:
+        out = np.empty(np.broadcast(lat1, lon1, lat2, lon2).shape)
+    
+    a = np.subtract(lat2, lat1, out=out)
+    a *= 0.5
+    np.sin(a, out=a)
+    np.square(a, out=a)
+    
+    term = np.subtract(lon2, lon1, out=np.empty_like(a))
+    term *= 0.5
+    np.sin(term, out=term)
+    np.square(term, out=term)
+    term *= np.cos(lat1)
+    term *= np.cos(lat2)
+    a += term
+    
+    np.clip(a, 0.0, 1.0, out=a)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * EARTH_RADIUS_KM
+    return a
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_bulk(lat0, lon0, lats, lons, out):
+        """Distances in kilometers from (lat0, lon0) to each (lats[i], lons[i]), written to out."""
+        cos_lat0 = math.cos(math.radians(lat0))
+        for i in prange(lats.shape[0]):
+            dlat = math.radians(lats[i] - lat0)
+            dlon = math.radians(lons[i] - lon0)
+            a = (math.sin(dlat / 2) ** 2 +
+                 cos_lat0 * math.cos(math.radians(lats[i])) * math.sin(dlon / 2) ** 2)
+            out[i] = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+def warm_distance_kernels():
+    """Compile the Numba haversine kernel up front so the first request doesn't pay for it."""
+    if NUMBA_AVAILABLE:
+        calculate_distance(0.0, 0.0, np.zeros(1), np.zeros(1))
+
+# Hotspots are cached per H3 cell (resolution 6 is roughly 36 km^2) so map
+# requests read a handful of keys instead of scanning every hotspot
+HOTSPOT_H3_RESOLUTION = 6
+HOTSPOT_H3_EDGE_KM = 3.72  # Average hexagon edge length at resolution 6
+HOTSPOT_CACHE_TTL = 900
+HOTSPOT_LOCK_TTL = 10
+
+@lru_cache(maxsize=1)
+def _hotspot_cache():
+    """Redis client for the hotspot cell cache, or None when unavailable."""
+    redis_url = os.getenv('REDIS_URL')
+    if not (REDIS_AVAILABLE and H3_AVAILABLE and redis_url):
+        return None
+    return redis.Redis.from_url(redis_url)
+
+def cache_hotspots_by_cell(hotspots):
+    """
+    Store hotspots in Redis grouped by the H3 cell of their centroid.
+    
+    Each cell is refreshed under a short NX lock so concurrent Agent 1 runs do
+    not rebuild the same key at once; a run that loses the lock leaves the
+    current value in place.
+    
+    Returns:
+        Number of cells written
+    """
+    client = _hotspot_cache()
+    if client is None:
+        return 0
+    
+    cells = {}
+    for hotspot in hotspots:
+        centroid = hotspot.get('location_details', {}).get('centroid')
+        if centroid:
+            cell = _h3_cell(centroid['latitude'], centroid['longitude'], HOTSPOT_H3_RESOLUTION)
+            cells.setdefault(cell, []).append(hotspot)
+    
+    try:
+        locked = [cell for cell in cells
+                  if client.set(f'hotspots:lock:{cell}', 1, nx=True, ex=HOTSPOT_LOCK_TTL)]
+        pipe = client.pipeline(transaction=False)
+        for cell in locked:
+            pipe.set(f'hotspots:h3:{cell}', orjson.dumps(cells[cell]), ex=HOTSPOT_CACHE_TTL)
+            pipe.delete(f'hotspots:lock:{cell}')
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Hotspot cache update failed: {e}")
+        return 0
+    
+    return len(locked)
+
+def nearby_hotspots(lat, lon, radius_km, min_severity=0):
+    """
+    Cached hotspots within radius_km of (lat, lon).
+    
+    Reads every H3 cell whose hexagon can reach the radius, then applies the
+    same distance and severity filter as the in-process index, so each
+    worker gives the same answer.
+    
+    Args:
+        lat, lon: Query point in degrees
+        radius_km: Search radius
+        min_severity: Minimum URGENCY_SEVERITY level to include
+        
+    Returns:
+        List of hotspot dicts, empty when the cache is unavailable or cold
+    """
+    client = _hotspot_cache()
+    if client is None:
+        return []
+    
+    # Neighbouring cell centres are sqrt(3) edge lengths apart; one extra ring
+    # covers hotspots near the far edge of the outermost cells
+    rings = math.ceil(radius_km / (math.sqrt(3) * HOTSPOT_H3_EDGE_KM)) + 1
+    cell = _h3_cell(lat, lon, HOTSPOT_H3_RESOLUTION)
+    keys = [f'hotspots:h3:{neighbour}' for neighbour in _h3_disk(cell, rings)]
+    try:
+        values = client.mget(keys)
+    except redis.RedisError as e:
+        logger.warning(f"Hotspot cache read failed: {e}")
+        return []
+    
+    candidates = [hotspot for value in values if value for hotspot in orjson.loads(value)]
+    return _batch_within(build_hotspot_batch(candidates), lat, lon, radius_km, min_severity)
+
+# In-process spatial index over the latest Agent 1 hotspots, swapped as a whole
+# under the lock when Agent 1 rebuilds it
+HOTSPOT_RADIUS_KM = 50
+URGENCY_SEVERITY = {'Low': 1, 'Medium': 2, 'High': 3}
+_HOTSPOT_INDEX_LOCK = threading.RLock()
+_hotspot_index = None
+
+class HotspotBatch(NamedTuple):
+    """
+    Column-oriented view of located hotspots.
+    
+    lats/lons are float32 and severity int8 NumPy arrays when NumPy is
+    installed (plain lists otherwise); hotspots holds the original dicts in
+    the same order.
+    """
+    ids: list
+    lats: object
+    lons: object
+    severity: object
+    hotspots: list
+
+def build_hotspot_batch(hotspots):
+    """Pack hotspots that have a centroid into a HotspotBatch."""
+    located = [h for h in hotspots if h.get('location_details', {}).get('centroid')]
+    ids = [h.get('id') for h in located]
+    lats = [h['location_details']['centroid']['latitude'] for h in located]
+    lons = [h['location_details']['centroid']['longitude'] for h in located]
+    severity = [URGENCY_SEVERITY.get(h.get('overall_urgency'), 0) for h in located]
+    
+    if NUMPY_AVAILABLE:
+        lats = np.array(lats, dtype=np.float32)
+        lons = np.array(lons, dtype=np.float32)
+        severity = np.array(severity, dtype=np.int8)
+    
+    return HotspotBatch(ids, lats, lons, severity, located)
+
+def index_hotspots(hotspots):
+    """
+    Rebuild the in-process hotspot index.
+    
+    Uses a haversine BallTree when scikit-learn and NumPy are installed;
+    otherwise keeps the coordinate columns for a scan.
+    """
+    global _hotspot_index
+    
+    batch = build_hotspot_batch(hotspots)
+    tree = None
+    if SKLEARN_AVAILABLE and NUMPY_AVAILABLE and batch.ids:
+        tree = BallTree(np.radians(np.column_stack((batch.lats, batch.lons)).astype(np.float64)),
+                        metric='haversine')
+    
+    with _HOTSPOT_INDEX_LOCK:
+        _hotspot_index = (tree, batch)
+
+def hotspots_within(lat, lon, radius_km=HOTSPOT_RADIUS_KM, min_severity=0):
+    """
+    Hotspots whose centroid lies within radius_km of (lat, lon).
+    
+    Reads the in-process index once Agent 1 has run in this process, and
+    falls back to the Redis cell cache before that.
+    
+    Args:
+        lat, lon: Query point in degrees
+        radius_km: Search radius
+        min_severity: Minimum URGENCY_SEVERITY level to include
+    """
+    with _HOTSPOT_INDEX_LOCK:
+        index = _hotspot_index
+    if index is None:
+        return nearby_hotspots(lat, lon, radius_km, min_severity)
+    
+    tree, batch = index
+    if tree is not None:
+        matches = tree.query_radius(np.radians([[lat, lon]]), r=radius_km / EARTH_RADIUS_KM)[0]
+        return [batch.hotspots[i] for i in matches if batch.severity[i] >= min_severity]
+    
+    return _batch_within(batch, lat, lon, radius_km, min_severity)
+
+def _batch_within(batch, lat, lon, radius_km, min_severity):
+    """Scan a HotspotBatch for hotspots within radius_km and at or above min_severity."""
+    if NUMPY_AVAILABLE:
+        if not batch.ids:
+            return []
+        distances = calculate_distance(lat, lon, batch.lats, batch.lons)
+        matches = np.flatnonzero((distances <= radius_km) & (batch.severity >= min_severity))
+        return [batch.hotspots[i] for i in matches]
+    
+    return [hotspot for hotspot, hotspot_lat, hotspot_lon, level
+            in zip(batch.hotspots, batch.lats, batch.lons, batch.severity)
+            if level >= min_severity and calculate_distance(lat, lon, hotspot_lat, hotspot_lon) <= radius_km]
 
 # ==============================================================================
 # BASIC HTML TEMPLATES (For Testing)
 # ==============================================================================
 
+def _write_if_changed(path, content):
+    """Write a template file only when its content differs from what is on disk.
+    
+    Args:
+        path: Template file path
+        content: Desired file content
+        
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.read_text(encoding='utf-8') == content:
+            return False
+    except FileNotFoundError:
+        pass
+    
+    path.write_text(content, encoding='utf-8')
+    return True
+
 @app.route('/create-templates')
 def create_basic_templates():
     """Create basic HTML templates for testing."""
     
-    templates_dir = Path('templates')
+    templates_dir = TEMPLATES_DIR
     templates_dir.mkdir(exist_ok=True)
     
     # Create admin templates directory
@@ -694,15 +1192,11 @@ def create_basic_templates():
 </html>
     """
     
-    # Write template files
-    with open(templates_dir / 'admin' / 'dashboard.html', 'w', encoding='utf-8') as f:
-        f.write(admin_dashboard_html)
-    
-    with open(templates_dir / 'user' / 'dashboard.html', 'w', encoding='utf-8') as f:
-        f.write(user_dashboard_html)
-    
-    with open(templates_dir / 'user' / 'create_report.html', 'w', encoding='utf-8') as f:
-        f.write(create_report_html)
+    # Write template files, skipping any that are already up to date
+    written = 0
+    written += _write_if_changed(templates_dir / 'admin' / 'dashboard.html', admin_dashboard_html)
+    written += _write_if_changed(templates_dir / 'user' / 'dashboard.html', user_dashboard_html)
+    written += _write_if_changed(templates_dir / 'user' / 'create_report.html', create_report_html)
     
     # Create placeholder templates for other routes
     placeholder_templates = {
@@ -714,26 +1208,59 @@ def create_basic_templates():
     }
     
     for template_path, content in placeholder_templates.items():
-        template_file = templates_dir / template_path
-        with open(template_file, 'w', encoding='utf-8') as f:
-            f.write(f'<!DOCTYPE html><html><head><title>Coastal Disaster Management</title></head><body>{content}</body></html>')
+        written += _write_if_changed(
+            templates_dir / template_path,
+            f'<!DOCTYPE html><html><head><title>Coastal Disaster Management</title></head><body>{content}</body></html>'
+        )
+    
+    return jsonify({'message': 'Basic templates created successfully!', 'written': written})
+
+def warm_template_cache():
+    """Compile every template up front so first requests skip Jinja parsing.
+    
+    Returns:
+        Number of templates compiled
+    """
+    compiled = 0
+    for template_name in app.jinja_env.list_templates(extensions=['html']):
+        try:
+            app.jinja_env.get_template(template_name)
+            compiled += 1
+        except Exception as e:
+            logger.warning(f"Could not compile template {template_name}: {e}")
+    return compiled
+
+def setup_app():
+    """Prepare the app for serving: template files and the Jinja bytecode cache.
+    
+    Basic templates are generated only when the templates folder is missing.
+    Run once per process before serving, from __main__ or as a gunicorn app
+    factory ('app_dual_portal_fixed:setup_app()').
     
-    return jsonify({'message': 'Basic templates created successfully!'})
+    Returns:
+        The Flask app
+    """
+    if not TEMPLATES_DIR.exists():
+        with app.app_context():
+            create_basic_templates()
+        logger.info(f"Generated basic templates in {TEMPLATES_DIR}")
+    
+    JINJA_CACHE_DIR.mkdir(exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+    return app
 
 # ==============================================================================
 # APPLICATION STARTUP
 # ==============================================================================
 
 if __name__ == '__main__':
+    _report_env()
     print("🌊 Starting Coastal Disaster Management System...")
     
-    # Create basic templates on startup
-    try:
-        with app.app_context():
-            create_basic_templates()
-        print("✅ Basic templates created")
-    except Exception as e:
-        print(f"⚠️ Template creation failed: {e}")
+    setup_app()
+    print(f"✅ {warm_template_cache()} templates compiled")
+    
+    warm_distance_kernels()
     
     # Initialize database if available
     try:
@@ -774,9 +1301,14 @@ if __name__ == '__main__':
     print("📋 Admin Dashboard: http://localhost:5000/admin")
     print("👥 User Portal: http://localhost:5000/user")
     
-    # Start Flask development server
+    # The Werkzeug server is for development only; production runs under gunicorn
+    if os.getenv('ENVIRONMENT', 'development') != 'development':
+        print("\n❌ Refusing to start the development server outside development.")
+        print("   Run: gunicorn -c gunicorn.conf.py --chdir tests 'app_dual_portal_fixed:setup_app()'")
+        sys.exit(1)
+    
     app.run(
-        debug=True if os.getenv('ENVIRONMENT') != 'production' else False,
+        debug=True,
         host='0.0.0.0',
         port=int(os.getenv('PORT', 5000))
     )
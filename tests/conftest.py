@@ -0,0 +1,15 @@
+"""
+Shared pytest setup for the test scripts in this directory.
+
+Puts the project's src/ directory on sys.path once per session and keeps
+Twilio and LLM calls off the network (set COASTAL_OFFLINE=0 to opt out).
+"""
+import os
+import sys
+from pathlib import Path
+
+SRC_DIR = str(Path(__file__).resolve().parent.parent / 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+os.environ.setdefault('COASTAL_OFFLINE', '1')
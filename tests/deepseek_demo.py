@@ -4,7 +4,10 @@ import json
 import argparse
 import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
+import orjson
 
 # Load environment variables
 load_dotenv()
@@ -14,6 +17,30 @@ DEEPSEEK_API_KEY = os.getenv('OPENROUTER_API_KEY') or os.getenv('DEEPSEEK_API_KE
 DEEPSEEK_BASE_URL = os.getenv('DEEPSEEK_BASE_URL', 'https://openrouter.ai/api/v1')
 DEEPSEEK_MODEL = os.getenv('DEEPSEEK_MODEL', 'deepseek/deepseek-chat')
 
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with pooled connections and retries for transient errors."""
+    session = requests.Session()
+    session.headers.update({
+        'Authorization': f'Bearer {DEEPSEEK_API_KEY}',
+        'Content-Type': 'application/json'
+    })
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(['POST']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared session so repeated calls reuse the TCP/TLS connection
+_SESSION = _build_session()
+
 SYSTEM_PROMPT = (
     "You are an expert multilingual AI agent specializing in ocean hazard monitoring and disaster intelligence for India.\n"
     "You analyze real-time citizen and social media reports about hazards such as floods, tsunamis, storm surges, coastal erosion, high waves, and abnormal tides.\n"
@@ -62,29 +89,91 @@ USER_PROMPT_TEMPLATE = (
     "}}"
 )
 
+# Render the template once with placeholder markers and keep the literal text
+# between fields, so building a prompt is a plain concatenation
+_PROMPT_MARKER = '\x00'
+_PROMPT_HEAD, _PROMPT_AFTER_TEXT, _PROMPT_AFTER_TIMESTAMP, _PROMPT_TAIL = USER_PROMPT_TEMPLATE.format(
+    post_text=_PROMPT_MARKER,
+    timestamp=_PROMPT_MARKER,
+    location=_PROMPT_MARKER,
+).split(_PROMPT_MARKER)
+
+
+def build_user_prompt(post_text: str, timestamp: str, location: str) -> str:
+    """Fill USER_PROMPT_TEMPLATE without re-parsing it on every call."""
+    return f"{_PROMPT_HEAD}{post_text}{_PROMPT_AFTER_TEXT}{timestamp}{_PROMPT_AFTER_TIMESTAMP}{location}{_PROMPT_TAIL}"
+
+
 def extract_json_from_response(content: str) -> str:
     content = content.strip()
-    if content.startswith('```json') and content.endswith('```'):
-        lines = content.split('\n')
-        json_lines = lines[1:-1]
-        return '\n'.join(json_lines)
     if content.startswith('```') and content.endswith('```'):
-        lines = content.split('\n')
-        json_lines = lines[1:-1]
-        return '\n'.join(json_lines)
+        first_newline = content.find('\n')
+        last_newline = content.rfind('\n')
+        if first_newline == last_newline:
+            return ''
+        return content[first_newline + 1:last_newline]
     return content
 
 
-def call_deepseek(system_prompt: str, user_prompt: str):
+def _stream_completion(url: str, payload: dict) -> str:
+    """Stream a chat completion and return the first complete JSON object.
+
+    The connection is closed as soon as the object's closing brace arrives, so
+    any trailing fence or commentary is never generated or downloaded. If the
+    stream ends first, whatever text arrived is returned.
+    """
+    pieces = []
+    depth = 0
+    start = None
+    in_string = False
+    escaped = False
+    offset = 0
+
+    with _SESSION.post(url, json={**payload, 'stream': True}, stream=True, timeout=60) as resp:
+        if resp.status_code != 200:
+            print(f"ERROR: DeepSeek API error {resp.status_code}: {resp.text}", file=sys.stderr)
+            sys.exit(2)
+        for line in resp.iter_lines():
+            # Skip keep-alive comments and blank separators
+            if not line.startswith(b'data: '):
+                continue
+            data = line[6:]
+            if data == b'[DONE]':
+                break
+            choices = orjson.loads(data).get('choices') or [{}]
+            piece = choices[0].get('delta', {}).get('content') or ''
+            pieces.append(piece)
+
+            # Track brace depth outside of string literals
+            for i, ch in enumerate(piece):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == '\\':
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"' and start is not None:
+                    in_string = True
+                elif ch == '{':
+                    if start is None:
+                        start = offset + i
+                    depth += 1
+                elif ch == '}' and start is not None:
+                    depth -= 1
+                    if depth == 0:
+                        return ''.join(pieces)[start:offset + i + 1]
+            offset += len(piece)
+
+    return ''.join(pieces).strip()
+
+
+def call_deepseek(system_prompt: str, user_prompt: str, stream: bool = True):
     if not DEEPSEEK_API_KEY:
         print("ERROR: DeepSeek/OpenRouter API key not configured in environment (OPENROUTER_API_KEY or DEEPSEEK_API_KEY)", file=sys.stderr)
         sys.exit(1)
 
     url = f"{DEEPSEEK_BASE_URL}/chat/completions"
-    headers = {
-        'Authorization': f'Bearer {DEEPSEEK_API_KEY}',
-        'Content-Type': 'application/json'
-    }
     payload = {
         'model': DEEPSEEK_MODEL,
         'messages': [
@@ -94,15 +183,18 @@ def call_deepseek(system_prompt: str, user_prompt: str):
         'temperature': 0.1,
         'max_tokens': 600
     }
-    resp = requests.post(url, headers=headers, json=payload, timeout=60)
-    if resp.status_code != 200:
-        print(f"ERROR: DeepSeek API error {resp.status_code}: {resp.text}", file=sys.stderr)
-        sys.exit(2)
-    data = resp.json()
-    content = data['choices'][0]['message']['content'].strip()
+    if stream:
+        content = _stream_completion(url, payload)
+    else:
+        resp = _SESSION.post(url, json=payload, timeout=60)
+        if resp.status_code != 200:
+            print(f"ERROR: DeepSeek API error {resp.status_code}: {resp.text}", file=sys.stderr)
+            sys.exit(2)
+        data = resp.json()
+        content = data['choices'][0]['message']['content'].strip()
     json_str = extract_json_from_response(content)
     try:
-        obj = json.loads(json_str)
+        obj = orjson.loads(json_str)
     except json.JSONDecodeError:
         print("ERROR: Model output was not valid JSON:")
         print(content)
@@ -115,15 +207,12 @@ def main():
     parser.add_argument('--text', required=True, help='Tweet text')
     parser.add_argument('--timestamp', default=datetime.datetime.utcnow().isoformat() + 'Z')
     parser.add_argument('--location', default='Delhi, India')
+    parser.add_argument('--no-stream', action='store_true', help='Wait for the full completion instead of streaming')
     args = parser.parse_args()
 
-    user_prompt = USER_PROMPT_TEMPLATE.format(
-        post_text=args.text,
-        timestamp=args.timestamp,
-        location=args.location,
-    )
+    user_prompt = build_user_prompt(args.text, args.timestamp, args.location)
 
-    result = call_deepseek(SYSTEM_PROMPT, user_prompt)
+    result = call_deepseek(SYSTEM_PROMPT, user_prompt, stream=not args.no_stream)
     print(json.dumps(result, ensure_ascii=False, indent=2))
 
 
@@ -5,12 +5,20 @@ Use this to test alert functionality without the web interface.
 """
 
 import sys
+import csv
+import asyncio
+import argparse
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path for imports
-sys.path.append(str(Path(__file__).parent / 'src'))
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))
 
-from services.twilio_alert_service import twilio_service
+from services.twilio_alert_service import twilio_service, iter_results
+from _util import short
+
+# Console icon per bulk result status
+_ICONS = {'sent': '✅', 'called': '✅', 'failed': '❌', 'error': '❌'}
 
 def send_test_sms():
     """Send a test SMS alert."""
@@ -84,11 +92,16 @@ def send_test_voice_call():
     else:
         print(f"❌ Voice call failed: {result}")
 
-def send_bulk_alerts():
-    """Send alerts to multiple recipients."""
-    print("📢 Sending bulk alerts...")
-    
-    # Multiple recipients
+def load_recipients_csv(path: str) -> list:
+    """Read bulk recipients from a CSV with phone_number and (optional) name columns."""
+    with open(path, newline='', encoding='utf-8') as f:
+        return [
+            {'phone_number': (row.get('phone_number') or '').strip(), 'name': (row.get('name') or '').strip() or "User"}
+            for row in csv.DictReader(f)
+        ]
+
+def prompt_recipients() -> list:
+    """Collect bulk recipients interactively, one phone number at a time."""
     recipients = []
     print("Enter recipient phone numbers (press Enter with empty line to finish):")
     
@@ -98,6 +111,20 @@ def send_bulk_alerts():
             break
         name = input(f"Name for {phone}: ").strip() or "User"
         recipients.append({'phone_number': phone, 'name': name})
+    return recipients
+
+def send_bulk_alerts(recipients=None, alert_type=None):
+    """
+    Send alerts to multiple recipients.
+    
+    Args:
+        recipients: Recipient dicts; prompted for interactively when omitted
+        alert_type: 'sms', 'voice' or 'both'; prompted for when omitted
+    """
+    print("📢 Sending bulk alerts...")
+    
+    if recipients is None:
+        recipients = prompt_recipients()
     
     if not recipients:
         print("❌ No recipients provided")
@@ -118,28 +145,53 @@ def send_bulk_alerts():
     message = "BULK TEST: Storm surge warning for multiple coastal cities. This is a test of the bulk alert system. Please ignore if received."
     
     # Choose alert type
-    alert_type = input("Choose alert type (sms/voice/both) [sms]: ").strip().lower() or 'sms'
+    if alert_type is None:
+        alert_type = input("Choose alert type (sms/voice/both) [sms]: ").strip().lower() or 'sms'
     
+    # SMS and voice runs are independent, so "both" sends them concurrently
+    runs = []
     if alert_type in ['sms', 'both']:
         print("📱 Sending bulk SMS...")
-        sms_results = twilio_service.send_bulk_sms_alerts(recipients, message, report_data)
-        print(f"   SMS Results: {sms_results['successful']}/{sms_results['total']} successful")
-        
-        for detail in sms_results['details']:
-            status_icon = "✅" if detail['status'] == 'sent' else "❌"
-            print(f"   {status_icon} {detail['recipient']}: {detail.get('message_id', detail.get('error'))}")
+        runs.append(('SMS', twilio_service.send_bulk_sms_alerts_async(recipients, message, report_data)))
     
     if alert_type in ['voice', 'both']:
         print("📞 Making bulk voice calls...")
-        voice_results = twilio_service.make_bulk_voice_alerts(recipients, message, report_data)
-        print(f"   Voice Results: {voice_results['successful']}/{voice_results['total']} successful")
+        runs.append(('Voice', twilio_service.make_bulk_voice_alerts_async(recipients, message, report_data)))
+    
+    async def run_all():
+        return await asyncio.gather(*(run for _, run in runs))
+    
+    for (label, _), results in zip(runs, asyncio.run(run_all())):
+        print(f"   {label} Results: {results['successful']}/{results['total']} successful")
         
-        for detail in voice_results['details']:
-            status_icon = "✅" if detail['status'] == 'called' else "❌"
-            print(f"   {status_icon} {detail['recipient']}: {detail.get('call_id', detail.get('error'))}")
+        # One write for the whole run instead of a print (and flush) per recipient
+        lines = [
+            f"   {_ICONS.get(row.status, '❓')} {row.recipient}: {row.sid or row.error}"
+            for row in iter_results(results)
+        ]
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+@lru_cache(maxsize=1)
+def template_listing():
+    """Render the alert template menu once; the templates are fixed for the process."""
+    lines = []
+    for key, template in twilio_service.get_alert_templates().items():
+        lines.append(f"   {key.upper()}:")
+        lines.append(f"     SMS: {short(template['sms'])}")
+        lines.append(f"     Voice: {short(template['voice'])}")
+        lines.append("")
+    return "\n".join(lines)
 
 def main():
-    """Main menu for testing alerts."""
+    """Main menu for testing alerts, or a one-shot bulk send with --recipients-csv."""
+    parser = argparse.ArgumentParser(description='Send test alerts via Twilio')
+    parser.add_argument('--recipients-csv', help='Send bulk alerts to the phone_number/name rows of this CSV and exit')
+    parser.add_argument('--alert-type', choices=['sms', 'voice', 'both'], default='sms',
+                        help='Alert type for --recipients-csv (default: sms)')
+    args = parser.parse_args()
+    
     print("🚨 TWILIO ALERT SYSTEM - DIRECT TEST TOOL 🚨")
     print("=" * 50)
     
@@ -151,10 +203,17 @@ def main():
         print("- TWILIO_PHONE_NUMBER")
         return
     
+    # Handshake with Twilio while the user reads the menu
+    twilio_service.warm_up()
+    
     print("✅ Twilio service is ready!")
     print(f"📞 Using Twilio number: {twilio_service.phone_number}")
     print()
     
+    if args.recipients_csv:
+        send_bulk_alerts(load_recipients_csv(args.recipients_csv), args.alert_type)
+        return
+    
     while True:
         print("\nChoose an option:")
         print("1. Send test SMS")
@@ -173,12 +232,7 @@ def main():
             send_bulk_alerts()
         elif choice == '4':
             print("\n📝 Available Alert Templates:")
-            templates = twilio_service.get_alert_templates()
-            for key, template in templates.items():
-                print(f"   {key.upper()}:")
-                print(f"     SMS: {template['sms'][:80]}...")
-                print(f"     Voice: {template['voice'][:80]}...")
-                print()
+            print(template_listing())
         elif choice == '5':
             print("👋 Goodbye!")
             break
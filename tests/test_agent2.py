@@ -5,10 +5,13 @@ Simple test script for Agent 2
 import sys
 import asyncio
 import json
+from itertools import islice
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
+# Repo-root src/ for script runs (under pytest, conftest.py adds it)
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))
+
+from _util import short
 
 async def test_agent2():
     print("🚀 Testing Agent 2...")
@@ -51,10 +54,10 @@ async def test_agent2():
             correlations = result['social_media_correlations']
             print(f"📱 Social Media Matches Found: {len(correlations)}")
             
-            for i, corr in enumerate(correlations[:3], 1):  # Show first 3
+            for i, corr in enumerate(islice(correlations, 3), 1):  # Show first 3
                 score = corr.get('correlation_score', 0) * 100
                 preview = corr.get('post_text_preview', 'No preview')
-                print(f"   {i}. Score: {score:.1f}% - \"{preview[:80]}...\"")
+                print(f"   {i}. Score: {score:.1f}% - \"{short(preview)}\"")
         
         print("\n🎉 Agent 2 test completed successfully!")
         return result
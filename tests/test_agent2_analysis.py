@@ -6,15 +6,17 @@ with demo tweets, bypassing RapidAPI and Flask complexity.
 
 import sys
 import asyncio
+from pathlib import Path
 from dotenv import load_dotenv
 
+# Repo-root src/ for script runs (under pytest, conftest.py adds it)
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))
+
 # Load environment variables
 load_dotenv()
 
-# Add src to path
-sys.path.append('src')
-
 from agents.agent2_report_analysis import ReportAnalysisAgent
+from _util import short
 
 # Demo report data
 demo_report = {
@@ -61,38 +63,29 @@ async def test_agent2_analysis():
     # Initialize Agent 2
     agent = ReportAnalysisAgent()
     
-    # Test each demo tweet
+    # Score all demo tweets in one batched request (posts with a bad or
+    # missing verdict fall back to per-tweet and keyword analysis)
+    async with agent.http_session():
+        results = await agent._analyze_correlations_batch(demo_report, demo_tweets)
+    by_tweet_id = {result.get('post_id'): result for result in results if result}
+    
     for i, tweet in enumerate(demo_tweets, 1):
         print(f"\n📝 Testing Tweet {i}:")
-        print(f"   Text: {tweet['text'][:60]}...")
+        print(f"   Text: {short(tweet['text'], 60)}")
         print(f"   Language: {'Hindi' if 'यमुना' in tweet['text'] else 'English'}")
         
-        try:
-            # Call the analysis function directly
-            result = await agent._analyze_single_correlation(demo_report, tweet)
-            
+        result = by_tweet_id.get(tweet['id'])
+        if result:
             print(f"✅ Analysis Result:")
             print(f"   🔍 Hazard Detected: {result.get('hazard_detected', 'N/A')}")
             print(f"   🌊 Hazard Type: {result.get('hazard_type', 'N/A')}")
             print(f"   ⚡ Urgency: {result.get('urgency', 'N/A')}")
             print(f"   📊 Confidence: {result.get('confidence', 'N/A')}")
             print(f"   🌍 Language: {result.get('original_language', 'N/A')}")
-            print(f"   📋 Summary: {result.get('final_summary', 'N/A')[:80]}...")
-            print(f"   💡 Action: {result.get('recommended_action', 'N/A')[:60]}...")
-            
-        except Exception as e:
-            print(f"❌ Error analyzing tweet {i}: {str(e)}")
-            print(f"   Using fallback analysis...")
-            
-            # Test fallback
-            try:
-                fallback_result = agent._basic_hazard_analysis(demo_report, tweet)
-                print(f"🔄 Fallback Result:")
-                print(f"   🌊 Hazard Type: {fallback_result.get('hazard_type', 'N/A')}")
-                print(f"   ⚡ Urgency: {fallback_result.get('urgency', 'N/A')}")
-                print(f"   📊 Confidence: {fallback_result.get('confidence', 'N/A')}")
-            except Exception as e2:
-                print(f"❌ Fallback also failed: {str(e2)}")
+            print(f"   📋 Summary: {short(result.get('final_summary', 'N/A'))}")
+            print(f"   💡 Action: {short(result.get('recommended_action', 'N/A'), 60)}")
+        else:
+            print(f"❌ No analysis returned for tweet {i}")
         
         print("-" * 40)
     
@@ -6,8 +6,10 @@ import sys
 import asyncio
 from pathlib import Path
 
-# Add src to path  
-sys.path.append(str(Path(__file__).parent / 'src'))
+# Repo-root src/ for script runs (under pytest, conftest.py adds it)
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))
+
+from _util import short
 
 async def test_agent2_basic():
     print("🚀 Testing Agent 2 (Basic Mode - No API Keys Required)...")
@@ -51,7 +53,7 @@ async def test_agent2_basic():
         print(f"   Found {len(social_posts)} simulated posts")
         
         for i, post in enumerate(social_posts[:2], 1):
-            print(f"   Post {i}: \"{post.get('text', '')[:80]}...\"")
+            print(f"   Post {i}: \"{short(post.get('text', ''))}\"")
             print(f"            Location: {post.get('location', {})}")
             print(f"            Confidence: {post.get('confidence', 0)*100:.1f}%")
         
@@ -4,16 +4,19 @@ Test Agent 2 with full API functionality
 """
 import sys
 import asyncio
+from itertools import islice
 from pathlib import Path
 from dotenv import load_dotenv
 import os
 
+# Repo-root src/ for script runs (under pytest, conftest.py adds it)
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))
+
+from _util import short
+
 # Load environment variables first
 load_dotenv()
 
-# Add src to path  
-sys.path.append(str(Path(__file__).parent / 'src'))
-
 async def test_agent2_full():
     print("🚀 Testing Agent 2 (Full Mode with API Keys)...")
     
@@ -68,7 +71,7 @@ async def test_agent2_full():
             print(f"\n📱 Social Media Analysis:")
             print(f"   Total Matches Found: {len(correlations)}")
             
-            for i, corr in enumerate(correlations[:3], 1):  # Show first 3
+            for i, corr in enumerate(islice(correlations, 3), 1):  # Show first 3
                 score = corr.get('correlation_score', 0) * 100
                 conf = corr.get('confidence', 0) * 100
                 preview = corr.get('post_text_preview', 'No preview')
@@ -78,7 +81,7 @@ async def test_agent2_full():
                 print(f"      Score: {score:.1f}%")
                 print(f"      Confidence: {conf:.1f}%")  
                 print(f"      Matching: {', '.join(elements)}")
-                print(f"      Post: \"{preview[:60]}...\"")
+                print(f"      Post: \"{short(preview, 60)}\"")
         
         # Show processing errors if any
         if 'processing_error' in result:
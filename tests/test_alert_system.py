@@ -10,11 +10,14 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.append(str(Path(__file__).parent / 'src'))
+# Repo-root src/ for script runs (under pytest, conftest.py adds it)
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'src'))
 
 from services.twilio_alert_service import twilio_service
 
+# Console icon per bulk result status
+_ICONS = {'sent': '✅', 'called': '✅', 'failed': '❌', 'error': '❌'}
+
 def test_phone_number_formatting():
     """Test phone number formatting functionality."""
     print("🔍 Testing phone number formatting...")
@@ -224,9 +227,12 @@ def test_bulk_alerts():
     }
     
     print(f"    Total: {mock_sms_results['total']}, Success: {mock_sms_results['successful']}, Failed: {mock_sms_results['failed']}")
-    for detail in mock_sms_results['details']:
-        status_icon = "✅" if detail['status'] == 'sent' else "❌"
-        print(f"      {status_icon} {detail['recipient']}: {detail.get('message_id', detail.get('error'))}")
+    lines = [
+        f"      {_ICONS.get(d['status'], '❓')} {d['recipient']}: {d.get('message_id', d.get('error'))}"
+        for d in mock_sms_results['details']
+    ]
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
     
     print()
 
@@ -6,44 +6,211 @@ Test your Twitter API connection and search for hazard-related posts.
 
 import os
 import sys
-from dotenv import load_dotenv
+import json
+import argparse
+import time
+import re
+import random
+import asyncio
+import hashlib
+from contextlib import AsyncExitStack
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 
-# Load environment variables
-load_dotenv()
+import orjson
 
-def test_twitter_api_v2():
-    """Test Twitter API v2 with tweepy."""
+# ijson is optional; with it the RapidAPI probe stops reading the response
+# once it has the tweets it displays
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def load_env():
+    """
+    Load .env on first use rather than at import, so pytest collection stays cheap.
+    
+    Skipped entirely when COASTAL_GUARD_SKIP_DOTENV is set (CI injects the
+    variables directly).
+    """
+    if os.getenv('COASTAL_GUARD_SKIP_DOTENV'):
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Tweets requested per search call; 100 is the v2 search maximum, so one call
+# covers what used to take ten
+TWITTER_PAGE_SIZE = int(os.getenv('TWITTER_PAGE_SIZE', '100'))
+
+# Probe requests never change, so build them once
+TWITTER_V2_QUERY = 'flood India lang:en -is:retweet'
+TWITTER_V2_FIELDS = 'created_at,public_metrics'  # only what the listing prints; pre-joined, tweepy passes strings through
+RAPIDAPI_PARAMS = MappingProxyType({'query': 'flood India', 'max_results': str(TWITTER_PAGE_SIZE)})
+
+# Credential shapes, checked locally so a placeholder like "changeme" fails
+# without spending a request. Bearer tokens are long and URL-safe (often
+# percent-encoded); RapidAPI keys are long alphanumeric strings.
+BEARER_TOKEN_RE = re.compile(r'[A-Za-z0-9%+/=_-]{60,}')
+RAPIDAPI_KEY_RE = re.compile(r'[A-Za-z0-9]{40,}')
+
+# Console listing for one tweet; '.100' truncates the text to 100 characters
+V2_TWEET_FORMAT = "{i}. {text:.100}...\n   Created: {created_at}\n   Metrics: {public_metrics}\n\n"
+RAPIDAPI_TWEET_FORMAT = "{0}. {1:.100}...\n   User: @{2}\n\n"
+
+# Successful probe responses are cached on disk for one rate-limit window, so
+# re-running the script during development does not spend API quota. Entries
+# are keyed on a hash of the credential, so a rotated or revoked key is probed
+# afresh (TWITTER_PROBE_CACHE_TTL=0 or --no-cache always hits the network)
+PROBE_CACHE_DIR = Path(os.getenv('TWITTER_PROBE_CACHE_DIR',
+                                 Path.home() / '.cache' / 'coastal-guard' / 'twitter_probe'))
+PROBE_CACHE_TTL = int(os.getenv('TWITTER_PROBE_CACHE_TTL', '900'))
+
+# Tweets the RapidAPI probe lists (and, with ijson, the most it parses)
+RAPIDAPI_PREVIEW_COUNT = 5
+
+# Overall limit (seconds) on the probe race in main()
+PROBE_RACE_TIMEOUT = 15.0
+
+# Keep-alive pool for RapidAPI probes; every request goes to the same host
+RAPIDAPI_POOL_LIMIT = 10
+RAPIDAPI_POOL_PER_HOST = 4
+
+# Retry policy for throttled (429) and transient server errors from RapidAPI:
+# exponential backoff (1s, 2s, 4s, ...) with jitter, or Retry-After when sent
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 32.0
+
+def retry_delay(attempt, retry_after=None):
+    """Seconds to wait before retry number ``attempt`` (0-based), capped at RETRY_MAX_DELAY."""
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(RETRY_BASE_DELAY * 2 ** attempt + random.random() * 0.5, RETRY_MAX_DELAY)
+
+def probe_cache_path(endpoint, query, max_results, credential):
+    """Cache file for one (endpoint, query, page size, credential) probe."""
+    credential_hash = hashlib.sha256(credential.encode('utf-8')).hexdigest()
+    key = hashlib.sha1(json.dumps([endpoint, query, max_results, credential_hash]).encode('utf-8')).hexdigest()
+    return PROBE_CACHE_DIR / f"{key}.json"
+
+def load_cached_probe(path):
+    """Return the cached response body at path if it is younger than PROBE_CACHE_TTL, else None."""
+    if PROBE_CACHE_TTL <= 0:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime >= PROBE_CACHE_TTL:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+def store_probe(path, body):
+    """Write a response body to the probe cache; a failed write only costs the next run a request."""
+    if PROBE_CACHE_TTL <= 0:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(body, default=str), encoding='utf-8')
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+async def read_first_results(response):
+    """
+    Stream-parse the first RAPIDAPI_PREVIEW_COUNT items of the response's results array.
+    
+    The rest of the body is never downloaded or parsed; the connection is
+    closed rather than drained, which is cheaper than reading a full page of
+    tweets only to show five.
+    """
+    results = []
+    async for item in ijson.items_async(response.content, 'results.item'):
+        results.append(item)
+        if len(results) >= RAPIDAPI_PREVIEW_COUNT:
+            break
+    response.close()
+    return results
+
+def rapidapi_session(rapidapi_host):
+    """
+    Create a pooled aiohttp session for RapidAPI with the constant host header preset.
+    
+    Pass it to probe_rapidapi_twitter() when probing repeatedly (e.g. as a
+    health check) so later calls reuse the open TLS connection.
+    """
+    import aiohttp
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=RAPIDAPI_POOL_LIMIT, limit_per_host=RAPIDAPI_POOL_PER_HOST,
+                                       keepalive_timeout=30),
+        headers={'X-RapidAPI-Host': rapidapi_host},
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+
+async def probe_twitter_api_v2(use_cache=True):
+    """
+    Test Twitter API v2 with tweepy's asyncio client.
+    
+    Args:
+        use_cache: Accept a recent cached response instead of calling the API
+    """
     bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
     
     if not bearer_token:
         print("❌ TWITTER_BEARER_TOKEN not found in .env file")
         return False
     
+    if not BEARER_TOKEN_RE.fullmatch(bearer_token):
+        print("❌ TWITTER_BEARER_TOKEN looks malformed (placeholder or truncated?)")
+        return False
+    
     try:
-        import tweepy
-        
-        # Initialize Twitter API client
-        client = tweepy.Client(bearer_token=bearer_token)
-        
         # Test with a simple search
         print("🔍 Testing Twitter API v2 connection...")
         
-        tweets = client.search_recent_tweets(
-            query='flood India lang:en -is:retweet',
-            max_results=10,
-            tweet_fields=['created_at', 'public_metrics', 'geo', 'lang']
-        )
+        cache_path = probe_cache_path('twitter_v2', TWITTER_V2_QUERY, TWITTER_PAGE_SIZE, bearer_token)
+        tweets = load_cached_probe(cache_path) if use_cache else None
+        cached = tweets is not None
         
-        if tweets and tweets.data:
-            print(f"✅ Twitter API connection successful!")
-            print(f"📊 Found {len(tweets.data)} recent tweets about flooding in India:")
+        if not cached:
+            from tweepy.asynchronous import AsyncClient
+            
+            # Initialize Twitter API client. A 429 is reported as a failure
+            # rather than waited out, since the rate-limit window can be 15 minutes
+            client = AsyncClient(bearer_token=bearer_token, wait_on_rate_limit=False)
+            
+            try:
+                response = await client.search_recent_tweets(
+                    query=TWITTER_V2_QUERY,
+                    max_results=TWITTER_PAGE_SIZE,
+                    tweet_fields=TWITTER_V2_FIELDS
+                )
+            finally:
+                # tweepy opens its aiohttp session on first request and never closes it
+                if client.session is not None:
+                    await client.session.close()
+            tweets = [
+                {'text': tweet.text, 'created_at': tweet.created_at, 'public_metrics': tweet.public_metrics}
+                for tweet in (response.data if response and response.data else [])
+            ]
+            store_probe(cache_path, tweets)
+        
+        if tweets:
+            print(f"✅ Twitter API connection successful!{' (cached)' if cached else ''}")
+            print(f"📊 Found {len(tweets)} recent tweets about flooding in India:")
             print()
             
-            for i, tweet in enumerate(tweets.data, 1):
-                print(f"{i}. {tweet.text[:100]}...")
-                print(f"   Created: {tweet.created_at}")
-                print(f"   Metrics: {tweet.public_metrics}")
-                print()
+            # One write for the whole listing instead of four prints per tweet
+            sys.stdout.write(''.join(
+                V2_TWEET_FORMAT.format(i=i, **tweet) for i, tweet in enumerate(tweets[:10], 1)
+            ))
             
             return True
         else:
@@ -51,14 +218,21 @@ def test_twitter_api_v2():
             return True
             
     except ImportError:
-        print("❌ tweepy not installed. Run: pip install tweepy")
+        print("❌ tweepy (with async support) not installed. Run: pip install \"tweepy[async]\"")
         return False
     except Exception as e:
         print(f"❌ Twitter API error: {str(e)}")
         return False
 
-def test_rapidapi_twitter():
-    """Test Twitter access via RapidAPI."""
+async def probe_rapidapi_twitter(session=None, use_cache=True):
+    """
+    Test Twitter access via RapidAPI.
+    
+    Args:
+        session: Session from rapidapi_session() to reuse; a fresh one is
+            opened and closed for this call when omitted
+        use_cache: Accept a recent cached response instead of calling the API
+    """
     rapidapi_key = os.getenv('RAPIDAPI_KEY')
     rapidapi_host = os.getenv('RAPIDAPI_HOST', 'twitter-api47.p.rapidapi.com')
     
@@ -66,63 +240,141 @@ def test_rapidapi_twitter():
         print("❌ RAPIDAPI_KEY not found in .env file")
         return False
     
+    if not RAPIDAPI_KEY_RE.fullmatch(rapidapi_key):
+        print("❌ RAPIDAPI_KEY looks malformed (placeholder or truncated?)")
+        return False
+    
     try:
-        import requests
-        
         # Test RapidAPI Twitter endpoint
         print("🔍 Testing RapidAPI Twitter connection...")
         
         url = f"https://{rapidapi_host}/v2/search"
         
-        headers = {
-            'X-RapidAPI-Key': rapidapi_key,
-            'X-RapidAPI-Host': rapidapi_host
-        }
-        
-        params = {
-            'query': 'flood India',
-            'max_results': '10'
-        }
+        # X-RapidAPI-Host is a session default
+        headers = {'X-RapidAPI-Key': rapidapi_key}
         
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        cache_path = probe_cache_path(f'rapidapi:{rapidapi_host}', RAPIDAPI_PARAMS['query'], TWITTER_PAGE_SIZE,
+                                      rapidapi_key)
+        data = load_cached_probe(cache_path) if use_cache else None
+        cached = data is not None
+        status = 200 if cached else None
         
-        if response.status_code == 200:
-            data = response.json()
+        if not cached:
+            async with AsyncExitStack() as stack:
+                if session is None:
+                    session = await stack.enter_async_context(rapidapi_session(rapidapi_host))
+                for attempt in range(RETRY_MAX_ATTEMPTS + 1):
+                    async with session.get(url, headers=headers, params=RAPIDAPI_PARAMS) as response:
+                        status = response.status
+                        if status == 200:
+                            if IJSON_AVAILABLE:
+                                data = {'results': await read_first_results(response), 'partial': True}
+                            else:
+                                data = orjson.loads(await response.read())
+                            break
+                        error_text = await response.text()
+                        retry_after = response.headers.get('Retry-After')
+                    
+                    if status not in RETRY_STATUS_CODES or attempt == RETRY_MAX_ATTEMPTS:
+                        break
+                    delay = retry_delay(attempt, retry_after)
+                    print(f"⏳ RapidAPI returned {status}; retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
             
+            if status == 200:
+                store_probe(cache_path, data)
+        
+        if status == 200:
             if 'results' in data and data['results']:
-                print(f"✅ RapidAPI Twitter connection successful!")
-                print(f"📊 Found {len(data['results'])} tweets:")
+                print(f"✅ RapidAPI Twitter connection successful!{' (cached)' if cached else ''}")
+                if data.get('partial'):
+                    print(f"📊 Showing the first {len(data['results'])} tweets:")
+                else:
+                    print(f"📊 Found {len(data['results'])} tweets:")
                 print()
                 
-                for i, tweet in enumerate(data['results'][:5], 1):
-                    print(f"{i}. {tweet.get('text', '')[:100]}...")
-                    print(f"   User: @{tweet.get('username', 'unknown')}")
-                    print()
+                sys.stdout.write(''.join(
+                    RAPIDAPI_TWEET_FORMAT.format(i, tweet.get('text', ''), tweet.get('username', 'unknown'))
+                    for i, tweet in enumerate(data['results'][:RAPIDAPI_PREVIEW_COUNT], 1)
+                ))
                 
                 return True
             else:
                 print("✅ RapidAPI Twitter connected but no results found")
                 return True
         else:
-            print(f"❌ RapidAPI error: {response.status_code} - {response.text}")
+            print(f"❌ RapidAPI error: {status} - {error_text}")
             return False
             
     except ImportError:
-        print("❌ requests not installed. Run: pip install requests")
+        print("❌ aiohttp not installed. Run: pip install aiohttp")
         return False
     except Exception as e:
         print(f"❌ RapidAPI Twitter error: {str(e)}")
         return False
 
+def test_twitter_api_v2():
+    """Run the Twitter API v2 probe on its own."""
+    load_env()
+    return asyncio.run(probe_twitter_api_v2())
+
+def test_rapidapi_twitter():
+    """Run the RapidAPI probe on its own."""
+    load_env()
+    return asyncio.run(probe_rapidapi_twitter())
+
+async def run_probes(has_twitter, has_rapidapi, use_cache=True):
+    """
+    Race the configured probes; True as soon as one succeeds.
+    
+    Any channel is enough, so the first successful probe cancels the other,
+    saving that provider's quota. Gives up after PROBE_RACE_TIMEOUT seconds.
+    """
+    tasks = {}
+    if has_twitter:
+        print("🧪 Testing Twitter API v2...")
+        tasks[asyncio.ensure_future(probe_twitter_api_v2(use_cache))] = 'Twitter API v2'
+    if has_rapidapi:
+        print("🧪 Testing RapidAPI Twitter...")
+        tasks[asyncio.ensure_future(probe_rapidapi_twitter(use_cache=use_cache))] = 'RapidAPI'
+    
+    pending = set(tasks)
+    winner = None
+    deadline = time.monotonic() + PROBE_RACE_TIMEOUT
+    while pending and winner is None:
+        done, pending = await asyncio.wait(pending, timeout=max(deadline - time.monotonic(), 0),
+                                           return_when=asyncio.FIRST_COMPLETED)
+        if not done:
+            print(f"⏱️  No probe succeeded within {PROBE_RACE_TIMEOUT:.0f}s")
+            break
+        winner = next((tasks[task] for task in done if not task.cancelled() and task.result()), None)
+    
+    for task in pending:
+        task.cancel()
+    
+    print()
+    if winner:
+        print(f"🏁 {winner} succeeded first")
+    return winner is not None
+
 def main():
     """Main test function."""
+    parser = argparse.ArgumentParser(description='Test Twitter API connections')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always call the APIs instead of reusing a recent cached response')
+    args = parser.parse_args()
+    
+    load_env()
+    
     print("🐦 Twitter API Connection Test")
     print("=" * 50)
     print()
     
-    # Check which APIs are configured
-    has_twitter = bool(os.getenv('TWITTER_BEARER_TOKEN'))
-    has_rapidapi = bool(os.getenv('RAPIDAPI_KEY'))
+    # Check which APIs are configured (one lookup each; empty values count as unset)
+    env = os.environ
+    has_twitter = bool(env.get('TWITTER_BEARER_TOKEN'))
+    has_rapidapi = bool(env.get('RAPIDAPI_KEY'))
+    has_openrouter = bool(env.get('OPENROUTER_API_KEY'))
     
     if not has_twitter and not has_rapidapi:
         print("❌ No Twitter API credentials found!")
@@ -135,19 +387,8 @@ def main():
         print("🔧 For now, your demo works with sample data and real AI analysis!")
         return
     
-    success = False
-    
-    # Test Twitter API v2 first
-    if has_twitter:
-        print("🧪 Testing Twitter API v2...")
-        success = test_twitter_api_v2()
-        print()
-    
-    # Test RapidAPI if Twitter API failed or not available
-    if not success and has_rapidapi:
-        print("🧪 Testing RapidAPI Twitter...")
-        success = test_rapidapi_twitter()
-        print()
+    # Both probes are network-bound, so run them side by side
+    success = asyncio.run(run_probes(has_twitter, has_rapidapi, use_cache=not args.no_cache))
     
     if success:
         print("🎉 Twitter integration is ready!")
@@ -158,7 +399,7 @@ def main():
     
     print()
     print("🎯 Current Demo Status:")
-    print(f"  ✅ Real AI Analysis (OpenRouter): {'Yes' if os.getenv('OPENROUTER_API_KEY') else 'No'}")
+    print(f"  ✅ Real AI Analysis (OpenRouter): {'Yes' if has_openrouter else 'No'}")
     print(f"  {'✅' if success else '❌'} Twitter Data: {'Yes' if success else 'Sample Data Only'}")
     print(f"  ✅ Interactive UI: Yes")
     print(f"  ✅ Multi-language: Yes")